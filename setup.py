@@ -18,6 +18,7 @@ setup(
     long_description_content_type="text/markdown",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    py_modules=["main", "main_mock"],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -25,6 +26,12 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # Test runner for the suites under src/ and system/run_all_tests.py
+        "dev": ["pytest>=7.0"],
+        # HTTP record/replay for the demo scripts (DEMO_CASSETTE_DIR)
+        "demo": ["vcrpy>=4.0"],
+    },
     entry_points={
         "console_scripts": [
             "trading-bot=main:main",
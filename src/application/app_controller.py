@@ -5,12 +5,9 @@ Manages the main application loop and integration of all modules
 import logging
 import signal
 import sys
-import time
 import threading
-import os
-
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import time
+from typing import Optional
 
 from config.config_manager import ConfigManager
 from telegram_bot.bot_handler import TelegramBotHandler
@@ -20,6 +17,13 @@ from data_processing.arbitrage_detector import ArbitrageDetector
 from data_processing.service_controller import ServiceController
 from logging_module.logging_config import setup_logging, get_logger
 
+# Seconds between service status log lines in the main loop
+STATUS_LOG_INTERVAL = 60
+# Longest single wait on the shutdown event on Windows, which does not deliver
+# Ctrl+C while the main thread is blocked on a lock. Elsewhere signals
+# interrupt the wait, so it is not sliced (None)
+WAIT_SLICE = 1.0 if sys.platform == "win32" else None
+
 class ApplicationError(Exception):
     """Base exception for application errors"""
     pass
@@ -156,18 +160,21 @@ class ApplicationController:
         self.logger.info("Entering main application loop")
         
         try:
-            while self.running and not self.shutdown_event.is_set():
-                # Check service status
+            # Block on the shutdown event between status checks (in slices on
+            # Windows); stop() and the signal handlers set it
+            wait_step = WAIT_SLICE or STATUS_LOG_INTERVAL
+            slices_per_status = max(1, round(STATUS_LOG_INTERVAL / wait_step))
+            idle_slices = 0
+            while self.running and not self.shutdown_event.wait(timeout=wait_step):
+                idle_slices += 1
+                if idle_slices < slices_per_status:
+                    continue
+                idle_slices = 0
+                # Log service status periodically
                 if self.service_controller:
                     status = self.service_controller.get_service_status()
-                    # Log status periodically (every 60 seconds)
-                    if int(time.time()) % 60 == 0:
-                        self.logger.debug(f"Service status: Arbitrage monitoring: {status['arbitrage_service']['monitoring']}, "
-                                        f"Market view monitoring: {status['market_view_service']['monitoring']}")
-                
-                # Sleep to avoid excessive CPU usage
-                if self.shutdown_event.wait(timeout=1):
-                    break
+                    self.logger.debug(f"Service status: Arbitrage monitoring: {status['arbitrage_service']['monitoring']}, "
+                                    f"Market view monitoring: {status['market_view_service']['monitoring']}")
                     
         except Exception as e:
             self.logger.error(f"Error in main loop: {e}", exc_info=True)
@@ -187,7 +194,7 @@ class ApplicationController:
                 
             # Stop all services
             if self.service_controller:
-                self.service_controller.stop_all_services()
+                self.service_controller.close()
                 self.logger.info("All services stopped")
                 
             self.logger.info("Application stopped successfully")
@@ -208,6 +215,27 @@ class ApplicationController:
         self.stop()
         sys.exit(0)
         
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the application is stopped
+        
+        Args:
+            timeout (float): Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            bool: True if the application stopped, False if the wait timed out
+        """
+        if WAIT_SLICE is None:
+            return self.shutdown_event.wait(timeout)
+        # Wait in slices so Ctrl+C still reaches the main thread on Windows
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = WAIT_SLICE if deadline is None else min(WAIT_SLICE, deadline - time.monotonic())
+            if remaining <= 0:
+                return self.shutdown_event.is_set()
+            if self.shutdown_event.wait(remaining):
+                return True
+        
     def is_running(self) -> bool:
         """
         Check if application is running
@@ -1,4 +1,4 @@
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, get_config
 from .user_config_manager import UserConfigManager
 
-__all__ = ['ConfigManager', 'UserConfigManager']
\ No newline at end of file
+__all__ = ['ConfigManager', 'UserConfigManager', 'get_config']
\ No newline at end of file
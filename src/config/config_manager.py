@@ -2,6 +2,7 @@
 Configuration Manager for the Generic Trading Bot
 """
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 class ConfigManager:
@@ -10,6 +11,10 @@ class ConfigManager:
     def __init__(self):
         """Initialize configuration manager"""
         self._telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
+        # Receive Telegram updates through a webhook instead of long polling
+        self._telegram_use_webhook = os.getenv('TELEGRAM_USE_WEBHOOK', 'false').lower() == 'true'
+        self._telegram_webhook_url = os.getenv('TELEGRAM_WEBHOOK_URL')
+        self._telegram_webhook_port = int(os.getenv('TELEGRAM_WEBHOOK_PORT', '8443'))
         self._min_profit_percentage = float(os.getenv('MIN_PROFIT_PERCENTAGE', '0.5'))
         self._min_profit_absolute = float(os.getenv('MIN_PROFIT_ABSOLUTE', '1.0'))
         # Exchange configurations
@@ -34,6 +39,21 @@ class ConfigManager:
         """Set Telegram bot token"""
         self._telegram_token = token
         
+    @property
+    def telegram_use_webhook(self) -> bool:
+        """Whether the bot receives updates through a webhook"""
+        return self._telegram_use_webhook
+        
+    @property
+    def telegram_webhook_url(self) -> Optional[str]:
+        """Get the public base URL Telegram posts webhook updates to"""
+        return self._telegram_webhook_url
+        
+    @property
+    def telegram_webhook_port(self) -> int:
+        """Get the local port the webhook server listens on"""
+        return self._telegram_webhook_port
+        
     def get_exchange_config(self, exchange: str) -> Dict[str, Any]:
         """Get configuration for a specific exchange"""
         return self._exchange_configs.get(exchange, {
@@ -66,4 +86,19 @@ class ConfigManager:
         """Set minimum profit absolute value threshold"""
         self._min_profit_absolute = value
         
-    # Exchange API endpoints are now handled through ccxt
\ No newline at end of file
+    # Exchange API endpoints are now handled through ccxt
+
+@lru_cache(maxsize=None)
+def get_config() -> ConfigManager:
+    """
+    Get the process-wide ConfigManager, building it on first use
+    
+    Scripts and tests that only read settings share this instance instead of
+    re-reading the environment. Threshold setters on it are visible to every
+    caller, so components that tune their own thresholds should construct a
+    ConfigManager of their own.
+    
+    Returns:
+        ConfigManager: The shared configuration manager
+    """
+    return ConfigManager()
@@ -1,4 +1,5 @@
-from .market_data_fetcher import MarketDataFetcher
+from .market_data_fetcher import MarketDataFetcher, get_market_fetcher
 from .websocket_manager import WebSocketManager
+from .symbol_cache import get_all_symbols_cached
 
-__all__ = ['MarketDataFetcher', 'WebSocketManager']
\ No newline at end of file
+__all__ = ['MarketDataFetcher', 'get_market_fetcher', 'WebSocketManager', 'get_all_symbols_cached']
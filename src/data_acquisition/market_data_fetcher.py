@@ -5,13 +5,26 @@ import logging
 import time
 import ccxt
 import asyncio
-from typing import Dict, List, Optional
-from config.config_manager import ConfigManager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from config.config_manager import ConfigManager, get_config
 from utils.error_handler import (
     APIConnectionError, DataParsingError, RateLimitError, AuthenticationError,
     log_exception, handle_exception
 )
 
+# Keep-alive connections held per exchange host by the shared HTTP session
+HTTP_POOL_SIZE = 32
+
+def _create_http_session() -> requests.Session:
+    """Create the HTTP session shared by every CCXT client of a fetcher"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('https://', adapter)
+    return session
+
 class MarketDataFetcher:
     """Fetches market data using CCXT library"""
     
@@ -21,6 +34,10 @@ class MarketDataFetcher:
         self.logger = logging.getLogger(__name__)
         self.supported_exchanges = ['binance', 'okx']
         
+        # One connection pool for all exchange clients, so TCP and TLS setup
+        # is paid once per host rather than once per client
+        self.session = _create_http_session()
+        
         # Initialize CCXT clients for supported exchanges
         self.exchanges = {}
         enabled_exchanges = config.get_enabled_exchanges()
@@ -30,6 +47,7 @@ class MarketDataFetcher:
                 binance_config = config.get_exchange_config('binance')
                 self.exchanges['binance'] = ccxt.binance({
                     'enableRateLimit': True,
+                    'session': self.session,
                     'rateLimit': int(binance_config.get('rate_limit', 0.1) * 1000)  # CCXT uses milliseconds
                 })
                 self.logger.info("Initialized Binance CCXT client")
@@ -41,6 +59,7 @@ class MarketDataFetcher:
                 okx_config = config.get_exchange_config('okx')
                 self.exchanges['okx'] = ccxt.okx({
                     'enableRateLimit': True,
+                    'session': self.session,
                     'rateLimit': int(okx_config.get('rate_limit', 0.1) * 1000)  # CCXT uses milliseconds
                 })
                 self.logger.info("Initialized OKX CCXT client")
@@ -90,26 +109,36 @@ class MarketDataFetcher:
             log_exception(self.logger, e, f"Failed to fetch symbols from {exchange}")
             raise APIConnectionError(f"Failed to fetch symbols from {exchange}: {e}")
             
-    def get_all_symbols(self) -> Dict[str, List[str]]:
+    def iter_symbols_per_exchange(self) -> Iterator[Tuple[str, List[str]]]:
         """
-        Get available symbols for all supported exchanges
+        Lazily fetch available symbols one supported exchange at a time
         
-        Returns:
-            Dictionary mapping exchange names to symbol lists
+        Each exchange's markets are only loaded when the caller asks for the
+        next item, so a caller that stops early skips the remaining requests.
+        
+        Yields:
+            (exchange, symbols) tuples for exchanges that returned symbols
         """
-        all_symbols = {}
         for exchange in self.supported_exchanges:
             if exchange in self.exchanges:  # Only fetch for initialized exchanges
                 try:
                     # Add delay to avoid rate limiting
                     time.sleep(self.rate_limit_delays.get(exchange, 0.1))
                     symbols = self.get_available_symbols(exchange)
-                    if symbols:
-                        all_symbols[exchange] = symbols
                 except Exception as e:
                     self.logger.warning(f"Failed to get symbols from {exchange}: {e}")
-                    # Continue with other exchanges
-        return all_symbols
+                    continue  # Continue with other exchanges
+                if symbols:
+                    yield exchange, symbols
+                    
+    def get_all_symbols(self) -> Dict[str, List[str]]:
+        """
+        Get available symbols for all supported exchanges
+        
+        Returns:
+            Dictionary mapping exchange names to symbol lists
+        """
+        return dict(self.iter_symbols_per_exchange())
         
     @handle_exception(logger_name=__name__, reraise=False, default_return=None)
     def get_l1_market_data(self, exchange: str, symbol: str) -> Optional[Dict]:
@@ -332,4 +361,17 @@ class MarketDataFetcher:
                 except Exception as e:
                     self.logger.warning(f"Failed to get L2 data for {symbol} on {exchange}: {e}")
                     # Continue with other pairs
-        return results
\ No newline at end of file
+        return results
+
+@lru_cache(maxsize=None)
+def get_market_fetcher() -> MarketDataFetcher:
+    """
+    Get the process-wide MarketDataFetcher, building it on first use
+    
+    Scripts that run one after another in the same interpreter share its
+    exchange clients and keep-alive connections instead of opening new ones.
+    
+    Returns:
+        MarketDataFetcher: The shared market data fetcher
+    """
+    return MarketDataFetcher(get_config())
\ No newline at end of file
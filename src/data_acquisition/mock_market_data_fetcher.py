@@ -5,7 +5,7 @@ This allows running the system with simulated market data.
 import logging
 import random
 import time
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from config.config_manager import ConfigManager
 from data_acquisition.market_data_fetcher import MarketDataFetcher
 
@@ -47,23 +47,21 @@ class MockMarketDataFetcher(MarketDataFetcher):
             self.logger.error(f"Failed to get mock symbols from {exchange}: {e}")
             return None
             
-    def get_all_symbols(self) -> Dict[str, List[str]]:
+    def iter_symbols_per_exchange(self) -> Iterator[Tuple[str, List[str]]]:
         """
-        Get available symbols for all supported exchanges (mock implementation)
+        Lazily yield available symbols per supported exchange (mock implementation)
         
-        Returns:
-            Dictionary mapping exchange names to symbol lists
+        Yields:
+            (exchange, symbols) tuples for exchanges that returned symbols
         """
-        all_symbols = {}
         for exchange in self.supported_exchanges:
             try:
                 symbols = self.get_available_symbols(exchange)
-                if symbols:
-                    all_symbols[exchange] = symbols
             except Exception as e:
                 self.logger.warning(f"Failed to get mock symbols from {exchange}: {e}")
-                # Continue with other exchanges
-        return all_symbols
+                continue  # Continue with other exchanges
+            if symbols:
+                yield exchange, symbols
         
     def get_l1_market_data(self, exchange: str, symbol: str) -> Optional[Dict]:
         """
@@ -0,0 +1,43 @@
+"""
+HTTP recording for the demo scripts of the Generic Trading Bot
+
+When DEMO_CASSETTE_DIR is set, the exchange HTTP traffic of a demo run is
+recorded to a vcrpy cassette in that directory and replayed on later runs, so
+CI and regression checks do not download the same payloads again.
+"""
+import logging
+import os
+from contextlib import contextmanager
+
+try:
+    import vcr
+except ImportError:
+    vcr = None
+
+logger = logging.getLogger(__name__)
+
+@contextmanager
+def demo_cassette(name: str):
+    """
+    Record or replay the HTTP calls made inside the block
+
+    Requests already in the cassette are served from it; new ones go to the
+    network and are appended. Without DEMO_CASSETTE_DIR, or without vcrpy
+    installed, the block runs against the live exchanges.
+
+    Args:
+        name (str): Cassette name, usually the demo script's name
+    """
+    cassette_dir = os.getenv('DEMO_CASSETTE_DIR')
+    if not cassette_dir:
+        yield
+        return
+    if vcr is None:
+        logger.warning("DEMO_CASSETTE_DIR is set but vcrpy is not installed; using live data")
+        yield
+        return
+
+    cassette_path = os.path.join(cassette_dir, f"{name}.yaml")
+    with vcr.use_cassette(cassette_path, record_mode='new_episodes'):
+        logger.info(f"Recording/replaying exchange traffic with {cassette_path}")
+        yield
@@ -0,0 +1,83 @@
+"""
+On-disk cache of exchange symbol listings for the Generic Trading Bot
+
+Loading every market from every exchange is the slowest step of the demo and
+debug scripts; listings change rarely, so they are reused across runs until
+they go stale.
+"""
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+from data_acquisition.market_data_fetcher import MarketDataFetcher
+
+# How long a cached listing is reused before it is fetched again
+SYMBOL_CACHE_TTL = 3600
+SYMBOL_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "trading_bot", "symbols.json")
+
+logger = logging.getLogger(__name__)
+
+# Listings already read or fetched in this process, keyed like the file
+_memory_cache: Dict[str, Dict] = {}
+
+def _cache_key(market_fetcher: MarketDataFetcher) -> str:
+    """Key a listing by the set of exchanges the fetcher has clients for"""
+    return ",".join(sorted(market_fetcher.exchanges))
+
+def _read_cache_file(cache_path: str) -> Dict[str, Dict]:
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable symbol cache {cache_path}: {e}")
+        return {}
+
+def _write_cache_file(cache_path: str, entries: Dict[str, Dict]):
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write symbol cache {cache_path}: {e}")
+
+def get_all_symbols_cached(market_fetcher: MarketDataFetcher,
+                           ttl: float = SYMBOL_CACHE_TTL,
+                           cache_path: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Read-through cache in front of MarketDataFetcher.get_all_symbols
+
+    Args:
+        market_fetcher (MarketDataFetcher): Fetcher used on a cache miss
+        ttl (float): Seconds a cached listing stays fresh
+        cache_path (str): Cache file location, defaults to SYMBOL_CACHE_PATH
+
+    Returns:
+        Dictionary mapping exchange names to symbol lists
+    """
+    cache_path = cache_path or SYMBOL_CACHE_PATH
+    key = _cache_key(market_fetcher)
+    now = time.time()
+
+    entry = _memory_cache.get(key)
+    if entry is None:
+        entry = _read_cache_file(cache_path).get(key)
+    if entry is not None and now - entry['fetched_at'] < ttl:
+        _memory_cache[key] = entry
+        logger.debug(f"Using cached symbol listing for {key or 'no exchanges'}")
+        return entry['symbols']
+
+    all_symbols = market_fetcher.get_all_symbols()
+    # Don't pin a failed or partial fetch for the whole TTL
+    if all_symbols and len(all_symbols) == len(market_fetcher.exchanges):
+        entry = {'fetched_at': now, 'symbols': all_symbols}
+        _memory_cache[key] = entry
+        entries = _read_cache_file(cache_path)
+        entries[key] = entry
+        _write_cache_file(cache_path, entries)
+    return all_symbols
@@ -4,6 +4,8 @@ Arbitrage Detector for the Generic Trading Bot
 import logging
 import time
 import threading
+from concurrent.futures import Executor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, asdict
 from collections import defaultdict, deque
@@ -105,63 +107,7 @@ class ArbitrageDetector:
                     # Continue with other exchanges
                     
             # Compare prices across exchanges
-            for buy_exchange in market_data:
-                for sell_exchange in market_data:
-                    if buy_exchange != sell_exchange:
-                        try:
-                            buy_data = market_data[buy_exchange]
-                            sell_data = market_data[sell_exchange]
-                            
-                            # Validate required data fields
-                            required_fields = ['ask_price', 'bid_price', 'timestamp']
-                            for field in required_fields:
-                                if field not in buy_data or field not in sell_data:
-                                    raise MissingDataError(f"Missing {field} in market data")
-                                    
-                            # Get best bid and ask prices
-                            buy_price = buy_data.get('ask_price')  # Price to buy from this exchange
-                            sell_price = sell_data.get('bid_price')  # Price to sell to this exchange
-                            
-                            # Validate price data
-                            if buy_price is None or sell_price is None:
-                                self.logger.warning(f"Missing price data for {symbol} on {buy_exchange} or {sell_exchange}")
-                                continue
-                                
-                            if not isinstance(buy_price, (int, float)) or not isinstance(sell_price, (int, float)):
-                                raise InvalidDataError(f"Invalid price data for {symbol}")
-                                
-                            if buy_price <= 0 or sell_price <= 0:
-                                self.logger.debug(f"Invalid price values for {symbol}: buy={buy_price}, sell={sell_price}")
-                                continue
-                                
-                            if sell_price > buy_price:
-                                profit_percentage = ((sell_price - buy_price) / buy_price) * 100
-                                profit_absolute = sell_price - buy_price
-                                
-                                # Check for division by zero or invalid calculations
-                                if not isinstance(profit_percentage, (int, float)) or not isinstance(profit_absolute, (int, float)):
-                                    raise CalculationError(f"Invalid profit calculation for {symbol}")
-                                    
-                                # Check if opportunity meets thresholds
-                                if (profit_percentage >= self.thresholds.min_profit_percentage and 
-                                    profit_absolute >= self.thresholds.min_profit_absolute):
-                                    opportunity = ArbitrageOpportunity(
-                                        symbol=symbol,
-                                        buy_exchange=buy_exchange,
-                                        sell_exchange=sell_exchange,
-                                        buy_price=buy_price,
-                                        sell_price=sell_price,
-                                        profit_percentage=profit_percentage,
-                                        profit_absolute=profit_absolute,
-                                        timestamp=market_data[buy_exchange].get('timestamp', time.time()),
-                                        threshold_percentage=self.thresholds.min_profit_percentage,
-                                        threshold_absolute=self.thresholds.min_profit_absolute
-                                    )
-                                    opportunities.append(opportunity)
-                        except Exception as e:
-                            self.logger.warning(f"Error comparing prices for {symbol} between {buy_exchange} and {sell_exchange}: {e}")
-                            # Continue with other exchange pairs
-                                
+            opportunities = self._compare_exchanges(symbol, market_data)
             self.logger.info(f"Found {len(opportunities)} arbitrage opportunities for {symbol}")
             
         except Exception as e:
@@ -170,6 +116,142 @@ class ArbitrageDetector:
             
         return opportunities
         
+    @handle_exception(logger_name=__name__, reraise=False, default_return={})
+    def find_arbitrage_opportunities_batch(self, asset_exchanges: Dict[str, List[str]],
+                                           executor: Optional[Executor] = None,
+                                           timeout: Optional[float] = None) -> Dict[str, List[ArbitrageOpportunity]]:
+        """
+        Find arbitrage opportunities for several symbols in one pass
+        
+        Each (exchange, symbol) pair is fetched once, concurrently when an
+        executor is given, and every symbol is then scanned from memory.
+        
+        Args:
+            asset_exchanges (Dict[str, List[str]]): Mapping of symbols to exchange lists
+            executor (Executor, optional): Executor to run the fetches on
+            timeout (float, optional): Seconds to wait for all fetches
+            
+        Returns:
+            Dictionary mapping each symbol to its arbitrage opportunities
+        """
+        pairs = {
+            (exchange, symbol)
+            for symbol, exchanges in asset_exchanges.items() if symbol
+            for exchange in exchanges
+        }
+        
+        # Fetch market data for every pair once
+        fetched = {}
+        if executor is None:
+            for pair in pairs:
+                try:
+                    fetched[pair] = self.market_fetcher.get_l1_market_data(*pair)
+                except Exception as e:
+                    self.logger.warning(f"Failed to fetch data for {pair[1]} on {pair[0]}: {e}")
+        else:
+            futures = {executor.submit(self.market_fetcher.get_l1_market_data, *pair): pair for pair in pairs}
+            try:
+                for future in as_completed(futures, timeout=timeout):
+                    pair = futures[future]
+                    try:
+                        fetched[pair] = future.result()
+                    except Exception as e:
+                        self.logger.warning(f"Failed to fetch data for {pair[1]} on {pair[0]}: {e}")
+            except FutureTimeoutError:
+                self.logger.warning(f"Timed out fetching {len(pairs) - len(fetched)} of {len(pairs)} market data pairs")
+                # Drop the fetches still queued so a hanging exchange can't
+                # pile up work on the shared executor across passes
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+                
+        # Scan each symbol against the shared snapshot
+        results = {}
+        for symbol, exchanges in asset_exchanges.items():
+            if not symbol:
+                continue
+            market_data = {}
+            for exchange in exchanges:
+                data = fetched.get((exchange, symbol))
+                if data:
+                    market_data[exchange] = data
+                    self.latest_market_data[(exchange, symbol)] = data
+            results[symbol] = self._compare_exchanges(symbol, market_data)
+            
+        total = sum(len(opportunities) for opportunities in results.values())
+        self.logger.info(f"Found {total} arbitrage opportunities across {len(results)} symbols")
+        return results
+        
+    def _compare_exchanges(self, symbol: str, market_data: Dict[str, Dict]) -> List[ArbitrageOpportunity]:
+        """
+        Compare one symbol's prices across exchanges
+        
+        Args:
+            symbol (str): Trading symbol being compared
+            market_data (Dict[str, Dict]): L1 market data keyed by exchange
+            
+        Returns:
+            List of arbitrage opportunities that meet the thresholds
+        """
+        opportunities = []
+        for buy_exchange in market_data:
+            for sell_exchange in market_data:
+                if buy_exchange != sell_exchange:
+                    try:
+                        buy_data = market_data[buy_exchange]
+                        sell_data = market_data[sell_exchange]
+                        
+                        # Validate required data fields
+                        required_fields = ['ask_price', 'bid_price', 'timestamp']
+                        for field in required_fields:
+                            if field not in buy_data or field not in sell_data:
+                                raise MissingDataError(f"Missing {field} in market data")
+                                
+                        # Get best bid and ask prices
+                        buy_price = buy_data.get('ask_price')  # Price to buy from this exchange
+                        sell_price = sell_data.get('bid_price')  # Price to sell to this exchange
+                        
+                        # Validate price data
+                        if buy_price is None or sell_price is None:
+                            self.logger.warning(f"Missing price data for {symbol} on {buy_exchange} or {sell_exchange}")
+                            continue
+                            
+                        if not isinstance(buy_price, (int, float)) or not isinstance(sell_price, (int, float)):
+                            raise InvalidDataError(f"Invalid price data for {symbol}")
+                            
+                        if buy_price <= 0 or sell_price <= 0:
+                            self.logger.debug(f"Invalid price values for {symbol}: buy={buy_price}, sell={sell_price}")
+                            continue
+                            
+                        if sell_price > buy_price:
+                            profit_percentage = ((sell_price - buy_price) / buy_price) * 100
+                            profit_absolute = sell_price - buy_price
+                            
+                            # Check for division by zero or invalid calculations
+                            if not isinstance(profit_percentage, (int, float)) or not isinstance(profit_absolute, (int, float)):
+                                raise CalculationError(f"Invalid profit calculation for {symbol}")
+                                
+                            # Check if opportunity meets thresholds
+                            if (profit_percentage >= self.thresholds.min_profit_percentage and 
+                                profit_absolute >= self.thresholds.min_profit_absolute):
+                                opportunity = ArbitrageOpportunity(
+                                    symbol=symbol,
+                                    buy_exchange=buy_exchange,
+                                    sell_exchange=sell_exchange,
+                                    buy_price=buy_price,
+                                    sell_price=sell_price,
+                                    profit_percentage=profit_percentage,
+                                    profit_absolute=profit_absolute,
+                                    timestamp=market_data[buy_exchange].get('timestamp', time.time()),
+                                    threshold_percentage=self.thresholds.min_profit_percentage,
+                                    threshold_absolute=self.thresholds.min_profit_absolute
+                                )
+                                opportunities.append(opportunity)
+                    except Exception as e:
+                        self.logger.warning(f"Error comparing prices for {symbol} between {buy_exchange} and {sell_exchange}: {e}")
+                        # Continue with other exchange pairs
+        return opportunities
+        
     @handle_exception(logger_name=__name__, reraise=False, default_return=[])
     def find_synthetic_arbitrage_opportunities(self, base_asset: str, quote_assets: List[str]) -> List[ArbitrageOpportunity]:
         """
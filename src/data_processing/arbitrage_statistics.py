@@ -6,13 +6,20 @@ import json
 import csv
 import sqlite3
 import os
+import sys
 import time
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Sequence
 from dataclasses import asdict
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime
 from data_processing.models import ArbitrageStatistics, ArbitrageOpportunity
 
+OPPORTUNITY_FIELDS = (
+    'timestamp', 'symbol', 'buy_exchange', 'sell_exchange',
+    'buy_price', 'sell_price', 'profit_percentage', 'profit_absolute',
+    'threshold_percentage', 'threshold_absolute'
+)
+
 class ArbitrageLogger:
     """Handles logging of arbitrage opportunities and statistics calculation"""
     
@@ -21,6 +28,9 @@ class ArbitrageLogger:
         self.storage_type = storage_type
         self.storage_path = storage_path
         self.db_connection = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._json_file = None
         
         if not os.path.exists(storage_path):
             os.makedirs(storage_path)
@@ -31,12 +41,32 @@ class ArbitrageLogger:
             self._init_csv()
         elif storage_type == "json":
             self._init_json()
+
+        # The backend is fixed for the lifetime of the logger, so resolve the
+        # per-call dispatch once here instead of re-branching on storage_type
+        self._log_backend = {
+            'sqlite': self._log_to_sqlite,
+            'csv': self._log_to_csv,
+            'json': self._log_to_json,
+        }.get(storage_type, self._log_unsupported)
+        self._stats_backend = {
+            'sqlite': self._get_statistics_sqlite,
+            'csv': self._get_statistics_csv,
+            'json': self._get_statistics_json,
+        }.get(storage_type, self._get_statistics_unsupported)
             
     def _init_sqlite(self):
         try:
             db_path = os.path.join(self.storage_path, "arbitrage_opportunities.db")
             self.db_connection = sqlite3.connect(db_path, check_same_thread=False)
+            self.db_connection.row_factory = sqlite3.Row
             cursor = self.db_connection.cursor()
+            # WAL avoids rewriting a rollback journal on every commit, and
+            # NORMAL sync is durable enough in WAL mode for a log of signals
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA busy_timeout=5000")
+            cursor.execute("PRAGMA temp_store=MEMORY")
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS arbitrage_opportunities (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,84 +86,206 @@ class ArbitrageLogger:
         except Exception as e:
             self.logger.error(f"Error initializing SQLite: {e}")
 
-    # ... _init_csv and _init_json methods (keep existing logic) ...
-    def _init_csv(self): pass # Placeholder for brevity, assume existing logic
-    def _init_json(self): pass # Placeholder for brevity, assume existing logic
+    def _init_csv(self):
+        self.csv_path = os.path.join(self.storage_path, "arbitrage_opportunities.csv")
+        write_header = not os.path.exists(self.csv_path)
+        # Keep one append handle for the logger's lifetime; rows are buffered
+        # and reach the file on flush()/close() or when the buffer fills
+        self._csv_file = open(self.csv_path, 'a', newline='')
+        self._csv_writer = csv.writer(self._csv_file)
+        if write_header:
+            self._csv_writer.writerow(OPPORTUNITY_FIELDS)
+
+    def _init_json(self):
+        # JSON Lines: one object per line, appended like the CSV rows, so a
+        # write costs only the new records and a crash can at worst leave a
+        # torn last line rather than corrupt the whole history
+        self.json_path = os.path.join(self.storage_path, "arbitrage_opportunities.jsonl")
+        self._json_file = open(self.json_path, 'a')
+        # Terminate a torn last line so new records start on a line of their own
+        if self._json_file.tell() > 0:
+            with open(self.json_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._json_file.write('\n')
 
     def log_opportunity(self, opportunity: ArbitrageOpportunity):
         """Log an arbitrage opportunity to storage"""
         try:
-            if self.storage_type == "sqlite":
-                self._log_to_sqlite(opportunity)
-            # ... other types ...
+            self._log_backend((opportunity,))
         except Exception as e:
-            self.logger.error(f"Error logging opportunity: {e}")
+            self.logger.error(f"Error logging ({self.storage_type}): {e}")
 
-    def _log_to_sqlite(self, opportunity: ArbitrageOpportunity):
+    def log_opportunities(self, opportunities: Iterable[ArbitrageOpportunity]):
+        """Log several arbitrage opportunities with one commit/write"""
+        opportunities = list(opportunities)
+        if not opportunities:
+            return
         try:
-            cursor = self.db_connection.cursor()
-            cursor.execute('''
-                INSERT INTO arbitrage_opportunities (
-                    timestamp, symbol, buy_exchange, sell_exchange,
-                    buy_price, sell_price, profit_percentage, profit_absolute,
-                    threshold_percentage, threshold_absolute
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                opportunity.timestamp, opportunity.symbol, opportunity.buy_exchange,
-                opportunity.sell_exchange, opportunity.buy_price, opportunity.sell_price,
-                opportunity.profit_percentage, opportunity.profit_absolute,
-                opportunity.threshold_percentage, opportunity.threshold_absolute
-            ))
-            self.db_connection.commit()
+            self._log_backend(opportunities)
         except Exception as e:
-            self.logger.error(f"Error logging to SQLite: {e}")
+            self.logger.error(f"Error logging ({self.storage_type}): {e}")
+
+    def _log_to_sqlite(self, opportunities: Sequence[ArbitrageOpportunity]):
+        cursor = self.db_connection.cursor()
+        cursor.executemany('''
+            INSERT INTO arbitrage_opportunities (
+                timestamp, symbol, buy_exchange, sell_exchange,
+                buy_price, sell_price, profit_percentage, profit_absolute,
+                threshold_percentage, threshold_absolute
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (opportunity.timestamp, opportunity.symbol, opportunity.buy_exchange,
+             opportunity.sell_exchange, opportunity.buy_price, opportunity.sell_price,
+             opportunity.profit_percentage, opportunity.profit_absolute,
+             opportunity.threshold_percentage, opportunity.threshold_absolute)
+            for opportunity in opportunities
+        ])
+        self.db_connection.commit()
+
+    def _log_to_csv(self, opportunities: Sequence[ArbitrageOpportunity]):
+        self._csv_writer.writerows(
+            [getattr(opportunity, field) for field in OPPORTUNITY_FIELDS]
+            for opportunity in opportunities
+        )
+
+    def _log_to_json(self, opportunities: Sequence[ArbitrageOpportunity]):
+        self._json_file.writelines(
+            json.dumps(asdict(opportunity)) + '\n' for opportunity in opportunities
+        )
+
+    def _log_unsupported(self, opportunities: Sequence[ArbitrageOpportunity]):
+        pass
+
+    def flush(self):
+        """Push buffered CSV rows and JSON lines to their files"""
+        for f in (self._csv_file, self._json_file):
+            if f is not None and not f.closed:
+                f.flush()
+
+    def close(self):
+        """Flush pending rows and release the storage handles"""
+        for f in (self._csv_file, self._json_file):
+            if f is not None and not f.closed:
+                f.close()
+        if self.db_connection is not None:
+            self.db_connection.close()
+            self.db_connection = None
 
     def get_statistics(self, symbol: Optional[str] = None, hours: int = 24) -> ArbitrageStatistics:
         """Calculate arbitrage statistics"""
-        # Simplified for SQLite implementation
-        if self.storage_type != "sqlite":
-            return ArbitrageStatistics()
+        end_time = time.time()
+        start_time = end_time - (hours * 3600)
 
         try:
-            cursor = self.db_connection.cursor()
-            end_time = time.time()
-            start_time = end_time - (hours * 3600)
-            
-            query = "SELECT * FROM arbitrage_opportunities WHERE timestamp >= ?"
-            params = [start_time]
-            
-            if symbol:
-                query += " AND symbol = ?"
-                params.append(symbol)
-                
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            if not rows:
-                return ArbitrageStatistics(start_time=start_time, end_time=end_time)
-            
-            # Calculate stats
-            total_ops = len(rows)
-            spreads = [row[7] for row in rows] # profit_absolute index
-            avg_spread = sum(spreads) / len(spreads)
-            max_spread = max(spreads)
-            
-            # Grouping
-            ops_by_symbol = defaultdict(int)
-            ops_by_pair = defaultdict(int)
-            for row in rows:
-                ops_by_symbol[row[2]] += 1
-                ops_by_pair[f"{row[3]}-{row[4]}"] += 1
-            
-            return ArbitrageStatistics(
-                total_opportunities=total_ops,
-                average_spread=avg_spread,
-                max_spread=max_spread,
-                opportunities_by_symbol=dict(ops_by_symbol),
-                opportunities_by_exchange_pair=dict(ops_by_pair),
-                start_time=start_time,
-                end_time=end_time
-            )
+            return self._stats_backend(start_time, end_time, symbol)
         except Exception as e:
             self.logger.error(f"Error getting stats: {e}")
-            return ArbitrageStatistics()
\ No newline at end of file
+            return ArbitrageStatistics()
+
+    def _get_statistics_sqlite(self, start_time: float, end_time: float,
+                               symbol: Optional[str]) -> ArbitrageStatistics:
+        # Let SQLite do the grouping: one row per (symbol, exchange pair)
+        # comes back instead of one row per logged opportunity
+        cursor = self.db_connection.cursor()
+        cursor.arraysize = 100
+        params = [start_time]
+        symbol_clause = ""
+        if symbol:
+            symbol_clause = " AND symbol = ?"
+            params.append(symbol)
+
+        cursor.execute(
+            "SELECT symbol, buy_exchange || '-' || sell_exchange AS pair, "
+            "COUNT(*) AS n, SUM(profit_absolute) AS total, MAX(profit_absolute) AS peak "
+            "FROM arbitrage_opportunities WHERE timestamp >= ?" + symbol_clause +
+            " GROUP BY symbol, pair",
+            params
+        )
+        groups = cursor.fetchall()
+        if not groups:
+            return ArbitrageStatistics(start_time=start_time, end_time=end_time)
+
+        total_ops = 0
+        total_spread = 0.0
+        ops_by_symbol = Counter()
+        ops_by_pair = Counter()
+        for row in groups:
+            total_ops += row['n']
+            total_spread += row['total']
+            ops_by_symbol[row['symbol']] += row['n']
+            ops_by_pair[row['pair']] += row['n']
+
+        return ArbitrageStatistics(
+            total_opportunities=total_ops,
+            average_spread=round(total_spread / total_ops, 2),
+            max_spread=max(row['peak'] for row in groups),
+            opportunities_by_symbol=dict(ops_by_symbol),
+            opportunities_by_exchange_pair=dict(ops_by_pair),
+            start_time=start_time,
+            end_time=end_time
+        )
+
+    def _get_statistics_csv(self, start_time: float, end_time: float,
+                            symbol: Optional[str]) -> ArbitrageStatistics:
+        self.flush()
+        records = []
+        with open(self.csv_path, 'r', newline='') as f:
+            for row in csv.DictReader(f):
+                if float(row['timestamp']) < start_time:
+                    continue
+                if symbol and row['symbol'] != symbol:
+                    continue
+                records.append((sys.intern(row['symbol']), sys.intern(row['buy_exchange']),
+                                sys.intern(row['sell_exchange']), float(row['profit_absolute'])))
+        return self._aggregate(records, start_time, end_time)
+
+    def _get_statistics_json(self, start_time: float, end_time: float,
+                             symbol: Optional[str]) -> ArbitrageStatistics:
+        self.flush()
+        records = []
+        with open(self.json_path, 'r') as f:
+            for line in f:
+                try:
+                    e = json.loads(line)
+                except ValueError:
+                    continue  # Blank or torn line left by an interrupted write
+                if e['timestamp'] < start_time:
+                    continue
+                if symbol and e['symbol'] != symbol:
+                    continue
+                records.append((sys.intern(e['symbol']), sys.intern(e['buy_exchange']),
+                                sys.intern(e['sell_exchange']), e['profit_absolute']))
+        return self._aggregate(records, start_time, end_time)
+
+    def _get_statistics_unsupported(self, start_time: float, end_time: float,
+                                    symbol: Optional[str]) -> ArbitrageStatistics:
+        return ArbitrageStatistics(start_time=start_time, end_time=end_time)
+
+    def _aggregate(self, records: List[tuple], start_time: float, end_time: float) -> ArbitrageStatistics:
+        """Reduce (symbol, buy_exchange, sell_exchange, profit_absolute) records to statistics"""
+        if not records:
+            return ArbitrageStatistics(start_time=start_time, end_time=end_time)
+
+        # Split the rows into columns once, then reduce each column with
+        # builtins that loop in C instead of a per-row Python loop
+        symbols, buy_exchanges, sell_exchanges, spreads = zip(*records)
+
+        # Calculate stats
+        total_ops = len(records)
+        avg_spread = round(sum(spreads) / total_ops, 2)
+        max_spread = max(spreads)
+
+        # Grouping
+        ops_by_symbol = Counter(symbols)
+        ops_by_pair = Counter(map('-'.join, zip(buy_exchanges, sell_exchanges)))
+
+        return ArbitrageStatistics(
+            total_opportunities=total_ops,
+            average_spread=avg_spread,
+            max_spread=max_spread,
+            opportunities_by_symbol=dict(ops_by_symbol),
+            opportunities_by_exchange_pair=dict(ops_by_pair),
+            start_time=start_time,
+            end_time=end_time
+        )
@@ -0,0 +1,58 @@
+"""
+pytest configuration for the data processing tests
+"""
+import os
+import shutil
+import sys
+
+# Put src/ on the path once for the whole directory, so test modules can
+# import the data_processing package without patching sys.path themselves
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import pytest
+
+from config.config_manager import get_config
+from data_acquisition.market_data_fetcher import get_market_fetcher
+from data_processing.service_controller import ServiceController
+from data_processing.testing_utils import fast_tmpdir
+
+@pytest.fixture(scope="module", autouse=True)
+def private_cwd():
+    """Run each module from its own working dir
+    
+    ServiceController persists to relative paths, so without this parallel
+    workers (pytest -n auto) would race on the same files in the checkout.
+    The dir is on tmpfs when available, since those saves are fsync'd.
+    """
+    previous = os.getcwd()
+    cwd = fast_tmpdir()
+    os.chdir(cwd)
+    yield
+    os.chdir(previous)
+    shutil.rmtree(cwd, ignore_errors=True)
+
+@pytest.fixture(scope="session")
+def config():
+    """One ConfigManager for the whole test session"""
+    return get_config()
+
+@pytest.fixture(scope="session")
+def market_fetcher(config):
+    """One MarketDataFetcher (and its exchange clients) for the session"""
+    return get_market_fetcher()
+
+@pytest.fixture(scope="module")
+def idle_controller(market_fetcher, config):
+    """A ServiceController shared by a module's read-only tests; never start services on it"""
+    controller = ServiceController(market_fetcher, config)
+    yield controller
+    controller.close()
+
+@pytest.fixture
+def service_controller(market_fetcher, config):
+    """A fresh ServiceController per test, closed afterwards"""
+    controller = ServiceController(market_fetcher, config)
+    yield controller
+    controller.close()
@@ -4,14 +4,23 @@ Market View Module for the Generic Trading Bot
 import logging
 import time
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from typing import Dict, List, Optional
-from collections import defaultdict, deque
 from data_acquisition.market_data_fetcher import MarketDataFetcher
 from data_processing.models import MarketViewData, ConsolidatedMarketView
-from utils.error_handler import (
-    DataProcessingError, InvalidDataError, MissingDataError,
-    log_exception, handle_exception
-)
+from utils.error_handler import InvalidDataError, MissingDataError, log_exception
+
+# Upper bound on how long a consolidated view waits for one exchange
+FETCH_TIMEOUT = 5.0
+
+# Per-exchange fetches are network-bound, so they fan out on threads. Every
+# manager shares this one pool; it lives for the whole process and starts its
+# workers lazily, so creating managers never leaks threads
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="market-view-fetch")
+
+_bid_price = attrgetter('bid_price')
+_ask_price = attrgetter('ask_price')
 
 class MarketViewManager:
     """Manages consolidated market view across multiple exchanges"""
@@ -22,12 +31,17 @@ class MarketViewManager:
         self.logger = logging.getLogger(__name__)
         self.monitoring = False
         self.monitoring_thread = None
+        self._stop_event = threading.Event()
         self.monitored_symbols = {}  # symbol -> exchanges list
         self.latest_market_data = {}  # (exchange, symbol) -> MarketViewData
         self.consolidated_views = {}  # symbol -> ConsolidatedMarketView
-        self.supported_exchanges = ['binance', 'okx']
+        # Membership is checked per exchange on every consolidation; keep an
+        # ordered tuple alongside for the places that iterate
+        self._supported_ordered = ('binance', 'okx')
+        self.supported_exchanges = frozenset(self._supported_ordered)
+        # Exchanges of the last consolidation, the default for get_cbbo
+        self._last_exchanges = self._supported_ordered
         
-    @handle_exception(logger_name=__name__, reraise=False, default_return=None)
     def get_market_data(self, exchange: str, symbol: str) -> Optional[MarketViewData]:
         """Get market data for a specific exchange and symbol"""
         try:
@@ -42,21 +56,22 @@ class MarketViewManager:
             if not data:
                 return None
                 
-            # Validate required data fields
-            required_fields = ['bid_price', 'ask_price', 'bid_size', 'ask_size', 'timestamp']
-            for field in required_fields:
-                if field not in data:
-                    raise MissingDataError(f"Missing {field} in market data for {symbol} on {exchange}")
-                    
-            market_view = MarketViewData(
-                symbol=symbol,
-                exchange=exchange,
-                bid_price=data.get('bid_price', 0),
-                ask_price=data.get('ask_price', 0),
-                bid_size=data.get('bid_size', 0),
-                ask_size=data.get('ask_size', 0),
-                timestamp=data.get('timestamp', time.time())
-            )
+            # Validate required data fields in one pass: a missing key or a
+            # non-numeric price fails the unpacking below
+            try:
+                market_view = MarketViewData(
+                    symbol=symbol,
+                    exchange=exchange,
+                    bid_price=float(data['bid_price']),
+                    ask_price=float(data['ask_price']),
+                    bid_size=data['bid_size'],
+                    ask_size=data['ask_size'],
+                    timestamp=data['timestamp']
+                )
+            except KeyError as e:
+                raise MissingDataError(f"Missing {e.args[0]} in market data for {symbol} on {exchange}")
+            except (TypeError, ValueError) as e:
+                raise InvalidDataError(f"Invalid price in market data for {symbol} on {exchange}: {e}")
             
             # Cache the data
             self.latest_market_data[(exchange, symbol)] = market_view
@@ -64,76 +79,149 @@ class MarketViewManager:
             
         except Exception as e:
             log_exception(self.logger, e, f"Error getting market data for {symbol} on {exchange}")
-            raise DataProcessingError(f"Error getting market data for {symbol} on {exchange}: {e}")
+            return None
             
-    @handle_exception(logger_name=__name__, reraise=False, default_return=None)
-    def get_consolidated_market_view(self, symbol: str, exchanges: List[str]) -> Optional[ConsolidatedMarketView]:
-        """Get consolidated market view for a symbol across multiple exchanges"""
+    def get_market_data_batch(self, exchanges: List[str], symbol: str) -> Dict[str, MarketViewData]:
+        """Get market data for one symbol on several exchanges in one batch
+
+        The per-exchange requests run concurrently, so the batch costs one
+        round of exchange latency. Exchanges that fail or are unsupported are
+        left out of the result.
+        """
+        return self._collect_market_data(symbol, self._submit_fetches(symbol, exchanges))
+        
+    def get_consolidated_market_view(self, symbol: str, exchanges: List[str],
+                                     cached_only: bool = False) -> Optional[ConsolidatedMarketView]:
+        """Get consolidated market view for a symbol across multiple exchanges
+
+        With cached_only=True the view is built from latest_market_data alone,
+        without issuing any REST requests.
+        """
         try:
             if not symbol:
                 raise InvalidDataError("No symbol provided")
             if not exchanges:
                 raise InvalidDataError("No exchanges provided")
                 
-            exchanges_data = {}
+            if cached_only:
+                exchanges_data = {}
+                for exchange in exchanges:
+                    market_data = self.latest_market_data.get((exchange, symbol))
+                    if market_data:
+                        exchanges_data[exchange] = market_data
+            else:
+                self._last_exchanges = tuple(exchanges)
+                # One request per exchange in flight at a time, so wall time is
+                # the slowest exchange rather than the sum of all of them
+                exchanges_data = self._collect_market_data(symbol, self._submit_fetches(symbol, exchanges))
             
-            for exchange in exchanges:
-                try:
-                    if exchange in self.supported_exchanges:
-                        market_data = self.get_market_data(exchange, symbol)
-                        if market_data:
-                            exchanges_data[exchange] = market_data
-                except Exception as e:
-                    self.logger.warning(f"Failed to get market data for {symbol} on {exchange}: {e}")
+            return self._build_consolidated_view(symbol, exchanges_data)
             
-            if not exchanges_data:
-                self.logger.warning(f"No valid market data found for {symbol} on any exchange")
-                return None
-                
-            # Find CBBO (Consolidated Best Bid/Offer)
-            best_bid_price = 0.0
-            best_bid_exchange = ""
-            best_ask_price = float('inf')
-            best_ask_exchange = ""
+        except Exception as e:
+            log_exception(self.logger, e, f"Error creating consolidated market view for {symbol}")
+            return None
             
-            for exchange, data in exchanges_data.items():
-                # Check best bid (highest)
-                if data.bid_price > best_bid_price:
-                    best_bid_price = data.bid_price
-                    best_bid_exchange = exchange
-                
-                # Check best ask (lowest, non-zero)
-                if 0 < data.ask_price < best_ask_price:
-                    best_ask_price = data.ask_price
-                    best_ask_exchange = exchange
+    def get_consolidated_market_views(self, symbol_exchanges: Dict[str, List[str]]) -> Dict[str, ConsolidatedMarketView]:
+        """Get consolidated market views for several symbols in one batch
+
+        Every (exchange, symbol) request is submitted before any result is
+        awaited, so a full pass costs one round of exchange latency instead of
+        one round per symbol.
+        """
+        pending = {
+            symbol: self._submit_fetches(symbol, exchanges)
+            for symbol, exchanges in symbol_exchanges.items()
+            if symbol and exchanges
+        }
+        
+        views = {}
+        for symbol, futures in pending.items():
+            try:
+                view = self._build_consolidated_view(symbol, self._collect_market_data(symbol, futures))
+                if view:
+                    views[symbol] = view
+            except Exception as e:
+                log_exception(self.logger, e, f"Error creating consolidated market view for {symbol}")
+        return views
             
-            # Reset infinity if no valid ask found
-            if best_ask_price == float('inf'):
-                best_ask_price = 0.0
-                
-            consolidated_view = ConsolidatedMarketView(
-                symbol=symbol,
-                exchanges_data=exchanges_data,
-                cbbo_bid_exchange=best_bid_exchange,
-                cbbo_ask_exchange=best_ask_exchange,
-                cbbo_bid_price=best_bid_price,
-                cbbo_ask_price=best_ask_price,
-                timestamp=time.time()
-            )
+    def _submit_fetches(self, symbol: str, exchanges: List[str]) -> Dict[str, Future]:
+        """Submit a market data request per supported exchange"""
+        return {
+            exchange: _FETCH_POOL.submit(self.get_market_data, exchange, symbol)
+            for exchange in exchanges
+            if exchange in self.supported_exchanges
+        }
+        
+    def _collect_market_data(self, symbol: str, futures: Dict[str, Future]) -> Dict[str, MarketViewData]:
+        """Wait for submitted requests and keep the ones that returned data"""
+        exchanges_data = {}
+        for exchange, future in futures.items():
+            try:
+                market_data = future.result(timeout=FETCH_TIMEOUT)
+                if market_data:
+                    exchanges_data[exchange] = market_data
+            except Exception as e:
+                # A no-op once the fetch has finished; otherwise drops it from
+                # the shared pool's queue if it has not started yet
+                future.cancel()
+                self.logger.warning(f"Failed to get market data for {symbol} on {exchange}: {e}")
+        return exchanges_data
+        
+    def _build_consolidated_view(self, symbol: str,
+                                 exchanges_data: Dict[str, MarketViewData]) -> Optional[ConsolidatedMarketView]:
+        """Compute the CBBO over exchanges_data and cache the resulting view"""
+        if not exchanges_data:
+            self.logger.warning(f"No valid market data found for {symbol} on any exchange")
+            return None
             
-            self.consolidated_views[symbol] = consolidated_view
-            return consolidated_view
+        # Find CBBO (Consolidated Best Bid/Offer) using the builtin
+        # max/min reductions rather than a per-exchange compare loop
+        best_bid_price = 0.0
+        best_bid_exchange = ""
+        best_ask_price = 0.0
+        best_ask_exchange = ""
+        
+        # Best bid (highest, non-zero)
+        best_bid = max(exchanges_data.values(), key=_bid_price)
+        if best_bid.bid_price > 0:
+            best_bid_price = best_bid.bid_price
+            best_bid_exchange = best_bid.exchange
+        
+        # Best ask (lowest, non-zero)
+        best_ask = min(
+            (data for data in exchanges_data.values() if data.ask_price > 0),
+            key=_ask_price,
+            default=None
+        )
+        if best_ask is not None:
+            best_ask_price = best_ask.ask_price
+            best_ask_exchange = best_ask.exchange
             
-        except Exception as e:
-            log_exception(self.logger, e, f"Error creating consolidated market view for {symbol}")
-            return None
+        consolidated_view = ConsolidatedMarketView(
+            symbol=symbol,
+            exchanges_data=exchanges_data,
+            cbbo_bid_exchange=best_bid_exchange,
+            cbbo_ask_exchange=best_ask_exchange,
+            cbbo_bid_price=best_bid_price,
+            cbbo_ask_price=best_ask_price,
+            timestamp=time.time()
+        )
+        
+        self.consolidated_views[symbol] = consolidated_view
+        return consolidated_view
             
-    def get_cbbo(self, symbol: str) -> Optional[ConsolidatedMarketView]:
-        """Get current CBBO for a symbol"""
+    def get_cbbo(self, symbol: str, exchanges: Optional[List[str]] = None) -> Optional[ConsolidatedMarketView]:
+        """Get current CBBO for a symbol
+
+        A cached view is returned when it covers no exchanges outside
+        exchanges; otherwise the view is rebuilt over exchanges, or over the
+        exchanges of the last consolidation when none are given.
+        """
         try:
-            if symbol in self.consolidated_views:
-                return self.consolidated_views[symbol]
-            return self.get_consolidated_market_view(symbol, self.supported_exchanges)
+            view = self.consolidated_views.get(symbol)
+            if view and (exchanges is None or view.exchanges_data.keys() <= set(exchanges)):
+                return view
+            return self.get_consolidated_market_view(symbol, exchanges or self._last_exchanges)
         except Exception as e:
             self.logger.error(f"Error getting CBBO for {symbol}: {e}")
             return None
@@ -143,6 +231,7 @@ class MarketViewManager:
         if self.monitoring:
             return
         self.monitoring = True
+        self._stop_event.clear()
         self.monitored_symbols = symbol_exchanges
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitoring_thread.start()
@@ -151,6 +240,7 @@ class MarketViewManager:
     def stop_monitoring(self):
         """Stop market view monitoring"""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
         self.logger.info("Stopped market view monitoring")
@@ -159,12 +249,12 @@ class MarketViewManager:
         """Background loop for periodic market data checking"""
         while self.monitoring:
             try:
-                for symbol, exchanges in self.monitored_symbols.items():
-                    self.get_consolidated_market_view(symbol, exchanges)
-                time.sleep(1)
+                self.get_consolidated_market_views(self.monitored_symbols)
+                # Idle until the next poll, but wake at once on stop_monitoring
+                self._stop_event.wait(1)
             except Exception as e:
                 self.logger.error(f"Error in market view monitoring loop: {e}")
-                time.sleep(5)
+                self._stop_event.wait(5)
 
     def get_monitoring_status(self) -> Dict:
         return {
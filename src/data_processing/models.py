@@ -1,13 +1,36 @@
 """
 Data Models for the Generic Trading Bot
 Contains all dataclass definitions to avoid circular imports
+
+The per-tick models declare __slots__ by hand (dataclass(slots=True) needs
+Python 3.10) and are frozen, so instances carry no __dict__ and are safe
+to share between the monitoring threads.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Dict, List, Optional
 
-@dataclass
-class ArbitrageOpportunity:
+class _FrozenSlots:
+    """Pickle/copy support for frozen dataclasses with hand-written __slots__
+
+    Without a __dict__, the default reduce protocol restores state with
+    setattr, which a frozen dataclass rejects. These mirror the methods
+    dataclass(slots=True) generates.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def __setstate__(self, state):
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+
+@dataclass(frozen=True)
+class ArbitrageOpportunity(_FrozenSlots):
     """Represents an arbitrage opportunity"""
+    __slots__ = ('symbol', 'buy_exchange', 'sell_exchange', 'buy_price', 'sell_price',
+                 'profit_percentage', 'profit_absolute', 'timestamp',
+                 'threshold_percentage', 'threshold_absolute')
     symbol: str
     buy_exchange: str
     sell_exchange: str
@@ -19,9 +42,10 @@ class ArbitrageOpportunity:
     threshold_percentage: float
     threshold_absolute: float
 
-@dataclass
-class MarketViewData:
+@dataclass(frozen=True)
+class MarketViewData(_FrozenSlots):
     """Represents market view data for a symbol on an exchange"""
+    __slots__ = ('symbol', 'exchange', 'bid_price', 'ask_price', 'bid_size', 'ask_size', 'timestamp')
     symbol: str
     exchange: str
     bid_price: float
@@ -30,9 +54,11 @@ class MarketViewData:
     ask_size: float
     timestamp: float
 
-@dataclass
-class ConsolidatedMarketView:
+@dataclass(frozen=True)
+class ConsolidatedMarketView(_FrozenSlots):
     """Represents consolidated market view across multiple exchanges"""
+    __slots__ = ('symbol', 'exchanges_data', 'cbbo_bid_exchange', 'cbbo_ask_exchange',
+                 'cbbo_bid_price', 'cbbo_ask_price', 'timestamp')
     symbol: str
     exchanges_data: Dict[str, MarketViewData]
     cbbo_bid_exchange: str  # Exchange with best bid
@@ -2,14 +2,36 @@
 Persistence Manager for the Generic Trading Bot
 Handles saving and restoring monitoring states and configurations.
 """
+import copy
 import json
 import os
+import shutil
 import logging
 import threading
-import time
 from typing import Dict, List, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize monitoring data to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse monitoring data from JSON bytes"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Quiet period that lets a burst of updates coalesce into one write
+SAVE_DEBOUNCE = 0.1
+
 class PersistenceManager:
     """Manages persistence of monitoring states and configurations"""
     
@@ -34,6 +56,11 @@ class PersistenceManager:
             },
             'last_updated': None
         }
+        # Writers replace monitoring_data wholesale (copy-on-write) under this
+        # lock; readers and the auto-save thread just take the current reference
+        self._lock = threading.Lock()
+        self._dirty = False  # Set when state changes, cleared by a save
+        self._wake = threading.Event()  # Wakes the auto-save thread early
         self.save_thread = None
         self.save_interval = 30  # Save every 30 seconds
         self.running = False
@@ -53,6 +80,7 @@ class PersistenceManager:
     def stop_auto_save(self):
         """Stop automatic saving"""
         self.running = False
+        self._wake.set()
         if self.save_thread and self.save_thread.is_alive():
             self.save_thread.join()
         self.logger.info("Persistence auto-save stopped")
@@ -61,8 +89,16 @@ class PersistenceManager:
         """Background loop for automatic saving"""
         while self.running:
             try:
+                # Sleep until the interval elapses, a state update marks the
+                # data dirty, or stop_auto_save asks us to exit
+                self._wake.wait(timeout=self.save_interval)
+                self._wake.clear()
+                # Debounce: let a burst of updates settle into a single write
+                while self.running and self._wake.wait(timeout=SAVE_DEBOUNCE):
+                    self._wake.clear()
+                if not self.running:
+                    break
                 self.save_persistence_data()
-                time.sleep(self.save_interval)
             except Exception as e:
                 self.logger.error(f"Error in auto-save loop: {e}")
                 
@@ -78,16 +114,17 @@ class PersistenceManager:
             threshold_percentage (float): Profit percentage threshold
             threshold_absolute (float): Profit absolute threshold
         """
-        self.monitoring_data['arbitrage_monitoring'] = {
+        now = datetime.now().isoformat()
+        state = {
             'active': active,
-            'assets': assets,
+            'assets': copy.deepcopy(assets),
             'thresholds': {
                 'percentage': threshold_percentage,
                 'absolute': threshold_absolute
             },
-            'start_time': datetime.now().isoformat() if active else None
+            'start_time': now if active else None
         }
-        self.monitoring_data['last_updated'] = datetime.now().isoformat()
+        self._publish('arbitrage_monitoring', state, now)
         
     def update_market_view_state(self, active: bool, symbols: Dict[str, List[str]]):
         """
@@ -97,12 +134,23 @@ class PersistenceManager:
             active (bool): Whether market view monitoring is active
             symbols (Dict[str, List[str]]): Symbols being monitored
         """
-        self.monitoring_data['market_view_monitoring'] = {
+        now = datetime.now().isoformat()
+        state = {
             'active': active,
-            'symbols': symbols,
-            'start_time': datetime.now().isoformat() if active else None
+            'symbols': copy.deepcopy(symbols),
+            'start_time': now if active else None
         }
-        self.monitoring_data['last_updated'] = datetime.now().isoformat()
+        self._publish('market_view_monitoring', state, now)
+
+    def _publish(self, section: str, state: Dict[str, Any], updated_at: str):
+        """Atomically swap in a new monitoring_data snapshot with one section replaced"""
+        with self._lock:
+            snapshot = dict(self.monitoring_data)
+            snapshot[section] = state
+            snapshot['last_updated'] = updated_at
+            self.monitoring_data = snapshot
+            self._dirty = True
+        self._wake.set()
         
     def get_arbitrage_state(self) -> Dict[str, Any]:
         """
@@ -126,26 +174,61 @@ class PersistenceManager:
         """
         Save monitoring states to file
         
+        State lives in memory; this is a no-op when nothing changed since
+        the last successful save.
+        
         Returns:
             bool: True if successful, False otherwise
         """
+        if not self._dirty:
+            return True
+        # Clear the flag first so an update racing the save re-marks it
+        self._dirty = False
         try:
-            # Create backup of existing file
+            # Serialize a single published snapshot; writers never mutate it
+            data = _dumps(self.monitoring_data)
+            
+            # Write to a sibling temp file and make it durable
+            tmp_file = f"{self.persistence_file}.tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                # os.write may write only part of the buffer, and this file
+                # replaces the only good copy, so write until all of it is out
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+                
+            # Keep the last committed file as the backup. The live file is
+            # swapped out rather than rewritten, so a hard link to its inode
+            # preserves the old contents without copying any bytes
             if os.path.exists(self.persistence_file):
-                backup_file = f"{self.persistence_file}.backup"
-                os.replace(self.persistence_file, backup_file)
+                self._link_backup(f"{self.persistence_file}.backup")
                 
-            # Save current data
-            with open(self.persistence_file, 'w') as f:
-                json.dump(self.monitoring_data, f, indent=2)
+            os.replace(tmp_file, self.persistence_file)
                 
             self.logger.info(f"Monitoring states saved to {self.persistence_file}")
             return True
             
         except Exception as e:
+            self._dirty = True
             self.logger.error(f"Error saving monitoring states to {self.persistence_file}: {e}")
             return False
             
+    def _link_backup(self, backup_file: str):
+        """Point backup_file at the current persistence file"""
+        try:
+            os.unlink(backup_file)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(self.persistence_file, backup_file)
+        except OSError:
+            # Filesystem without hard links; fall back to copying the bytes
+            shutil.copyfile(self.persistence_file, backup_file)
+            
     def load_persistence_data(self) -> bool:
         """
         Load monitoring states from file
@@ -155,8 +238,8 @@ class PersistenceManager:
         """
         try:
             if os.path.exists(self.persistence_file):
-                with open(self.persistence_file, 'r') as f:
-                    self.monitoring_data = json.load(f)
+                with open(self.persistence_file, 'rb') as f:
+                    self.monitoring_data = _loads(f.read())
                     
                 self.logger.info(f"Monitoring states loaded from {self.persistence_file}")
                 return True
@@ -171,8 +254,8 @@ class PersistenceManager:
             if os.path.exists(backup_file):
                 self.logger.info(f"Attempting to load from backup file {backup_file}")
                 try:
-                    with open(backup_file, 'r') as f:
-                        self.monitoring_data = json.load(f)
+                    with open(backup_file, 'rb') as f:
+                        self.monitoring_data = _loads(f.read())
                     self.logger.info(f"Monitoring states loaded from backup {backup_file}")
                     return True
                 except Exception as backup_error:
@@ -191,23 +274,25 @@ class PersistenceManager:
             bool: True if successful, False otherwise
         """
         try:
-            self.monitoring_data = {
-                'arbitrage_monitoring': {
-                    'active': False,
-                    'assets': {},
-                    'thresholds': {
-                        'percentage': 0.5,
-                        'absolute': 1.0
+            with self._lock:
+                self.monitoring_data = {
+                    'arbitrage_monitoring': {
+                        'active': False,
+                        'assets': {},
+                        'thresholds': {
+                            'percentage': 0.5,
+                            'absolute': 1.0
+                        },
+                        'start_time': None
                     },
-                    'start_time': None
-                },
-                'market_view_monitoring': {
-                    'active': False,
-                    'symbols': {},
-                    'start_time': None
-                },
-                'last_updated': None
-            }
+                    'market_view_monitoring': {
+                        'active': False,
+                        'symbols': {},
+                        'start_time': None
+                    },
+                    'last_updated': None
+                }
+                self._dirty = True
             
             # Save cleared data
             return self.save_persistence_data()
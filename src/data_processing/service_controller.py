@@ -3,8 +3,11 @@ Service Controller for the Generic Trading Bot
 Manages the lifecycle of both Arbitrage Signal Service and Market View Service
 """
 import logging
+import queue
 import threading
 import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Set
 from data_processing.arbitrage_detector import ArbitrageDetector
 from data_processing.market_view import MarketViewManager
@@ -12,6 +15,27 @@ from data_processing.persistence_manager import PersistenceManager
 from data_acquisition.market_data_fetcher import MarketDataFetcher
 from config.config_manager import ConfigManager
 
+# Upper bound on how long one monitoring pass waits for every asset to report
+ARBITRAGE_PASS_TIMEOUT = 30.0
+
+# Status dicts are rebuilt at most this often; bursts of polls share one build
+STATUS_CACHE_TTL = 0.1
+
+# Market data fetches for every controller run on this one executor. It lives
+# for the whole process, so start/stop cycles never create or tear down
+# threads; its workers are started lazily on first use
+_SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="svc-shared")
+
+def _copy_status(status: Dict) -> Dict:
+    """Copy a cached status dict and its nested dicts for one caller
+
+    Read-only views (MappingProxyType) are shared as they are.
+    """
+    return {key: dict(value) if type(value) is dict else value for key, value in status.items()}
+
+# Queued to the persistence writer by close(): save once more, then exit
+_CLOSE = object()
+
 class ServiceController:
     """Manages the lifecycle of both monitoring services"""
     
@@ -25,22 +49,61 @@ class ServiceController:
         self.arbitrage_detector = ArbitrageDetector(market_fetcher, config)
         self.market_view_manager = MarketViewManager(market_fetcher)
         
+        # Both containers are created once in the services' __init__ and only
+        # mutated afterwards, so bind them here instead of probing per status call
+        self._arb_active_opps = getattr(self.arbitrage_detector, 'active_opportunities', {})
+        self._mv_consolidated = getattr(self.market_view_manager, 'consolidated_views', {})
+        
         # Initialize persistence manager
         self.persistence_manager = PersistenceManager()
         
         # Service state tracking
         self.arbitrage_monitoring = False
         self.market_view_monitoring = False
+        # The arbitrage loop runs on one long-lived daemon thread that parks
+        # between monitoring sessions, so start/stop cycles reuse it
         self.arbitrage_thread = None
-        self.market_view_thread = None
+        self._arb_resume = threading.Event()
+        self._arb_idle = threading.Event()
+        self._arb_idle.set()
+        self._closed = False
+        self._arb_stop = threading.Event()  # Wakes the arbitrage loop on stop
         
-        # Track active monitoring tasks
+        # Track active monitoring tasks. These dicts are never mutated in place:
+        # a change swaps in a new dict plus a read-only view of it, so status
+        # callers can be handed the view without copying
         self.arbitrage_assets: Dict[str, List[str]] = {}  # symbol -> exchanges
         self.market_view_symbols: Dict[str, List[str]] = {}  # symbol -> exchanges
+        self._arb_assets_view = MappingProxyType(self.arbitrage_assets)
+        self._mv_symbols_view = MappingProxyType(self.market_view_symbols)
         
-        # Track last update timestamps
+        # Track last update timestamps as time.monotonic_ns() (0 = never);
+        # status reports convert them to wall-clock time with this offset
         self.last_arbitrage_update = 0
         self.last_market_view_update = 0
+        self._wall_clock_offset = time.time() - time.monotonic_ns() / 1e9
+        
+        # Serialize start/stop per service; the unlocked checks in those
+        # methods are only a fast path
+        self._arb_lock = threading.Lock()
+        self._mv_lock = threading.Lock()
+        
+        # Saves are handed to one writer thread so start/stop calls don't wait
+        # on disk I/O; the lock keeps that writer and shutdown saves apart
+        self._persist_q = queue.SimpleQueue()
+        self._persist_lock = threading.Lock()
+        self._persist_thread = threading.Thread(
+            target=self._persist_worker, name="svc-persist", daemon=True
+        )
+        self._persist_thread.start()
+        
+        # Last built status dicts as (status, time.monotonic() when built,
+        # generation). start/stop bump the generation, so a status built
+        # concurrently with them is never served afterwards
+        self._arb_status_gen = 0
+        self._mv_status_gen = 0
+        self._arb_status_cache = (None, 0.0, 0)
+        self._mv_status_cache = (None, 0.0, 0)
         
         # Load saved monitoring states
         self._load_saved_states()
@@ -55,7 +118,7 @@ class ServiceController:
             if arb_state.get('active', False):
                 self.logger.info("Found saved arbitrage monitoring state, restoring...")
                 # We don't automatically start monitoring on load, but we preserve the configuration
-                self.arbitrage_assets = arb_state.get('assets', {})
+                self._set_arbitrage_assets(arb_state.get('assets', {}))
                 thresholds = arb_state.get('thresholds', {})
                 if thresholds:
                     self.arbitrage_detector.set_thresholds(
@@ -68,10 +131,24 @@ class ServiceController:
             if mv_state.get('active', False):
                 self.logger.info("Found saved market view monitoring state, restoring...")
                 # We don't automatically start monitoring on load, but we preserve the configuration
-                self.market_view_symbols = mv_state.get('symbols', {})
+                self._set_market_view_symbols(mv_state.get('symbols', {}))
                 
         except Exception as e:
             self.logger.error(f"Error loading saved states: {e}")
+            
+    def _set_arbitrage_assets(self, assets: Dict[str, List[str]]):
+        """Swap in a new arbitrage asset mapping and its read-only view"""
+        new_assets = dict(assets)
+        self.arbitrage_assets = new_assets
+        self._arb_assets_view = MappingProxyType(new_assets)
+        self._arb_status_gen += 1
+        
+    def _set_market_view_symbols(self, symbols: Dict[str, List[str]]):
+        """Swap in a new market view symbol mapping and its read-only view"""
+        new_symbols = dict(symbols)
+        self.market_view_symbols = new_symbols
+        self._mv_symbols_view = MappingProxyType(new_symbols)
+        self._mv_status_gen += 1
         
     # Arbitrage Signal Service Methods
     
@@ -94,36 +171,49 @@ class ServiceController:
                 self.logger.warning("Arbitrage monitoring is already running")
                 return False
                 
-            # Set thresholds if provided
-            if threshold_percentage is not None or threshold_absolute is not None:
-                self.arbitrage_detector.set_thresholds(threshold_percentage, threshold_absolute)
+            # Re-check under the lock so concurrent calls can't both get past it
+            with self._arb_lock:
+                if self.arbitrage_monitoring:
+                    self.logger.warning("Arbitrage monitoring is already running")
+                    return False
+                    
+                # Set thresholds if provided
+                if threshold_percentage is not None or threshold_absolute is not None:
+                    self.arbitrage_detector.set_thresholds(threshold_percentage, threshold_absolute)
                 
-            # Store monitoring configuration
-            self.arbitrage_assets = asset_exchanges
-            
-            # Start monitoring
-            self.arbitrage_monitoring = True
-            self.logger.info(f"Starting arbitrage monitoring for {len(asset_exchanges)} assets")
-            
-            # Start monitoring thread
-            self.arbitrage_thread = threading.Thread(target=self._arbitrage_monitoring_loop)
-            self.arbitrage_thread.daemon = True
-            self.arbitrage_thread.start()
+                # Store monitoring configuration
+                self._set_arbitrage_assets(asset_exchanges)
+            
+                # Start monitoring
+                self.arbitrage_monitoring = True
+                self._arb_status_gen += 1
+                self._arb_stop.clear()
+                self.logger.info(f"Starting arbitrage monitoring for {len(asset_exchanges)} assets")
+            
+                # Resume the monitoring thread, creating it on first use
+                self._arb_idle.clear()
+                self._arb_resume.set()
+                if self.arbitrage_thread is None:
+                    self.arbitrage_thread = threading.Thread(
+                        target=self._arbitrage_service, name="svc-arbitrage", daemon=True
+                    )
+                    self.arbitrage_thread.start()
             
-            # Save monitoring state
-            self.persistence_manager.update_arbitrage_state(
-                active=True,
-                assets=asset_exchanges,
-                threshold_percentage=self.arbitrage_detector.thresholds.min_profit_percentage,
-                threshold_absolute=self.arbitrage_detector.thresholds.min_profit_absolute
-            )
-            self.persistence_manager.save_persistence_data()
+                # Save monitoring state
+                self.persistence_manager.update_arbitrage_state(
+                    active=True,
+                    assets=asset_exchanges,
+                    threshold_percentage=self.arbitrage_detector.thresholds.min_profit_percentage,
+                    threshold_absolute=self.arbitrage_detector.thresholds.min_profit_absolute
+                )
+                self._persist_q.put(None)
             
-            return True
+                return True
             
         except Exception as e:
             self.logger.error(f"Error starting arbitrage monitoring: {e}")
             self.arbitrage_monitoring = False
+            self._arb_status_gen += 1
             return False
             
     def stop_arbitrage_monitoring(self) -> bool:
@@ -138,26 +228,34 @@ class ServiceController:
                 self.logger.info("Arbitrage monitoring is not running")
                 return True
                 
-            # Stop monitoring
-            self.arbitrage_monitoring = False
-            
-            # Wait for thread to finish
-            if self.arbitrage_thread and self.arbitrage_thread.is_alive():
-                self.arbitrage_thread.join(timeout=5)
+            # Re-check under the lock so concurrent calls can't both get past it
+            with self._arb_lock:
+                if not self.arbitrage_monitoring:
+                    self.logger.info("Arbitrage monitoring is not running")
+                    return True
+                    
+                # Stop monitoring and wake the loop so the join returns at once
+                self.arbitrage_monitoring = False
+                self._arb_status_gen += 1
+                self._arb_stop.set()
+            
+                # Wait for the loop to finish its pass and park
+                if not self._arb_idle.wait(timeout=5):
+                    self.logger.warning("Arbitrage monitoring loop did not stop within 5s")
                 
-            # Clear monitoring data
-            self.arbitrage_assets.clear()
+                # Clear monitoring data
+                self._set_arbitrage_assets({})
             
-            # Save monitoring state
-            self.persistence_manager.update_arbitrage_state(
-                active=False,
-                assets={}
-            )
-            self.persistence_manager.save_persistence_data()
+                # Save monitoring state
+                self.persistence_manager.update_arbitrage_state(
+                    active=False,
+                    assets={}
+                )
+                self._persist_q.put(None)
             
-            self.logger.info("Stopped arbitrage monitoring")
+                self.logger.info("Stopped arbitrage monitoring")
             
-            return True
+                return True
             
         except Exception as e:
             self.logger.error(f"Error stopping arbitrage monitoring: {e}")
@@ -170,49 +268,103 @@ class ServiceController:
         Returns:
             Dict with status information
         """
-        try:
-            # Get active opportunities from detector
-            active_opps = self.arbitrage_detector.active_opportunities if hasattr(self.arbitrage_detector, 'active_opportunities') else {}
+        now = time.monotonic()
+        generation = self._arb_status_gen
+        cached, built_at, cached_generation = self._arb_status_cache
+        if cached is not None and cached_generation == generation and now - built_at < STATUS_CACHE_TTL:
+            return _copy_status(cached)
             
-            return {
+        try:
+            status = {
                 'monitoring': self.arbitrage_monitoring,
-                'monitored_assets': self.arbitrage_assets,
-                'active_opportunities_count': len(active_opps),
-                'last_update': self.last_arbitrage_update,
+                'monitored_assets': self._arb_assets_view,
+                'active_opportunities_count': len(self._arb_active_opps),
+                'last_update': self._to_wall_clock(self.last_arbitrage_update),
+                'last_update_ns': self.last_arbitrage_update,
                 'thresholds': {
                     'percentage': self.arbitrage_detector.thresholds.min_profit_percentage,
                     'absolute': self.arbitrage_detector.thresholds.min_profit_absolute
                 }
             }
+            self._arb_status_cache = (status, now, generation)
+            return _copy_status(status)
         except Exception as e:
             self.logger.error(f"Error getting arbitrage status: {e}")
             return {
                 'monitoring': self.arbitrage_monitoring,
-                'monitored_assets': self.arbitrage_assets,
+                'monitored_assets': self._arb_assets_view,
                 'active_opportunities_count': 0,
-                'last_update': self.last_arbitrage_update,
+                'last_update': self._to_wall_clock(self.last_arbitrage_update),
+                'last_update_ns': self.last_arbitrage_update,
                 'error': str(e)
             }
             
+    def _arbitrage_service(self):
+        """Run the monitoring loop once per start_arbitrage_monitoring, parking in between
+
+        close() resumes the thread with _closed set, which ends it.
+        """
+        while True:
+            self._arb_resume.wait()
+            self._arb_resume.clear()
+            if self._closed:
+                return
+            try:
+                self._arbitrage_monitoring_loop()
+            finally:
+                self._arb_idle.set()
+                
     def _arbitrage_monitoring_loop(self):
         """Background loop for arbitrage monitoring"""
+        # Bind everything the loop calls once; arbitrage_assets is still read
+        # each pass because start/stop swap it
+        find = self._find_opportunities
+        logger = self.logger
+        monotonic_ns = time.monotonic_ns
+        wait_for_stop = self._arb_stop.wait
+        
         while self.arbitrage_monitoring:
             try:
-                # Check for arbitrage opportunities for each asset
-                for asset, exchanges in self.arbitrage_assets.items():
-                    opportunities = self.arbitrage_detector.find_arbitrage_opportunities(exchanges, asset)
-                    if opportunities:
-                        self.logger.info(f"Found {len(opportunities)} opportunities for {asset}")
-                        
+                # One batched detector call per pass; its market data fetches
+                # run concurrently on the pool so one slow exchange does not
+                # hold up the rest
+                results = find(self.arbitrage_assets)
+                # One summary line per pass; skip building it when INFO is off
+                if logger.isEnabledFor(logging.INFO):
+                    counts = {asset: len(opps) for asset, opps in results.items() if opps}
+                    if counts:
+                        logger.info("Found opportunities: %s", counts)
+                    
                 # Update timestamp
-                self.last_arbitrage_update = time.time()
+                self.last_arbitrage_update = monotonic_ns()
                 
-                # Sleep to avoid excessive CPU usage
-                time.sleep(1)  # Check every second
+                # Run a pass every second; a stop request ends the wait early
+                wait_for_stop(timeout=1.0)
                 
             except Exception as e:
-                self.logger.error(f"Error in arbitrage monitoring loop: {e}")
-                time.sleep(5)  # Sleep longer on error
+                logger.error(f"Error in arbitrage monitoring loop: {e}")
+                wait_for_stop(timeout=5.0)  # Back off longer on error
+        
+    def _find_opportunities(self, asset_exchanges: Dict[str, List[str]]) -> Dict[str, List]:
+        """One batched detector call for every monitored asset"""
+        return self.arbitrage_detector.find_arbitrage_opportunities_batch(
+            asset_exchanges, executor=_SHARED_EXECUTOR, timeout=ARBITRAGE_PASS_TIMEOUT
+        )
+        
+    def _persist_worker(self):
+        """Write persistence data whenever a save is requested"""
+        while True:
+            requests = [self._persist_q.get()]
+            # Requests queued meanwhile are covered by this one write
+            try:
+                while True:
+                    requests.append(self._persist_q.get_nowait())
+            except queue.Empty:
+                pass
+            with self._persist_lock:
+                self.persistence_manager.save_persistence_data()
+            if _CLOSE in requests:
+                return
                 
     # Market View Service Methods
     
@@ -231,26 +383,34 @@ class ServiceController:
                 self.logger.warning("Market view monitoring is already running")
                 return False
                 
-            # Store monitoring configuration
-            self.market_view_symbols = symbol_exchanges
+            # Re-check under the lock so concurrent calls can't both get past it
+            with self._mv_lock:
+                if self.market_view_monitoring:
+                    self.logger.warning("Market view monitoring is already running")
+                    return False
+                    
+                # Store monitoring configuration
+                self._set_market_view_symbols(symbol_exchanges)
+            
+                # Start monitoring through market view manager
+                self.market_view_manager.start_monitoring(symbol_exchanges)
+                self.market_view_monitoring = True
+                self._mv_status_gen += 1
+                self.logger.info(f"Started market view monitoring for {len(symbol_exchanges)} symbols")
+            
+                # Save monitoring state
+                self.persistence_manager.update_market_view_state(
+                    active=True,
+                    symbols=symbol_exchanges
+                )
+                self._persist_q.put(None)
             
-            # Start monitoring through market view manager
-            self.market_view_manager.start_monitoring(symbol_exchanges)
-            self.market_view_monitoring = True
-            self.logger.info(f"Started market view monitoring for {len(symbol_exchanges)} symbols")
-            
-            # Save monitoring state
-            self.persistence_manager.update_market_view_state(
-                active=True,
-                symbols=symbol_exchanges
-            )
-            self.persistence_manager.save_persistence_data()
-            
-            return True
+                return True
             
         except Exception as e:
             self.logger.error(f"Error starting market view monitoring: {e}")
             self.market_view_monitoring = False
+            self._mv_status_gen += 1
             return False
             
     def stop_market_view_monitoring(self) -> bool:
@@ -265,23 +425,30 @@ class ServiceController:
                 self.logger.info("Market view monitoring is not running")
                 return True
                 
-            # Stop monitoring through market view manager
-            self.market_view_manager.stop_monitoring()
-            self.market_view_monitoring = False
-            
-            # Clear monitoring data
-            self.market_view_symbols.clear()
-            
-            # Save monitoring state
-            self.persistence_manager.update_market_view_state(
-                active=False,
-                symbols={}
-            )
-            self.persistence_manager.save_persistence_data()
+            # Re-check under the lock so concurrent calls can't both get past it
+            with self._mv_lock:
+                if not self.market_view_monitoring:
+                    self.logger.info("Market view monitoring is not running")
+                    return True
+                    
+                # Stop monitoring through market view manager
+                self.market_view_manager.stop_monitoring()
+                self.market_view_monitoring = False
+                self._mv_status_gen += 1
+            
+                # Clear monitoring data
+                self._set_market_view_symbols({})
+            
+                # Save monitoring state
+                self.persistence_manager.update_market_view_state(
+                    active=False,
+                    symbols={}
+                )
+                self._persist_q.put(None)
+            
+                self.logger.info("Stopped market view monitoring")
             
-            self.logger.info("Stopped market view monitoring")
-            
-            return True
+                return True
             
         except Exception as e:
             self.logger.error(f"Error stopping market view monitoring: {e}")
@@ -294,26 +461,40 @@ class ServiceController:
         Returns:
             Dict with status information
         """
+        now = time.monotonic()
+        generation = self._mv_status_gen
+        cached, built_at, cached_generation = self._mv_status_cache
+        if cached is not None and cached_generation == generation and now - built_at < STATUS_CACHE_TTL:
+            return _copy_status(cached)
+            
         try:
             # Get status from market view manager
             manager_status = self.market_view_manager.get_monitoring_status()
             
-            return {
+            status = {
                 'monitoring': self.market_view_monitoring,
-                'monitored_symbols': self.market_view_symbols,
+                'monitored_symbols': self._mv_symbols_view,
                 'manager_status': manager_status,
-                'last_update': self.last_market_view_update,
-                'consolidated_views_count': len(self.market_view_manager.consolidated_views) if hasattr(self.market_view_manager, 'consolidated_views') else 0
+                'last_update': self._to_wall_clock(self.last_market_view_update),
+                'last_update_ns': self.last_market_view_update,
+                'consolidated_views_count': len(self._mv_consolidated)
             }
+            self._mv_status_cache = (status, now, generation)
+            return _copy_status(status)
         except Exception as e:
             self.logger.error(f"Error getting market view status: {e}")
             return {
                 'monitoring': self.market_view_monitoring,
-                'monitored_symbols': self.market_view_symbols,
-                'last_update': self.last_market_view_update,
+                'monitored_symbols': self._mv_symbols_view,
+                'last_update': self._to_wall_clock(self.last_market_view_update),
+                'last_update_ns': self.last_market_view_update,
                 'error': str(e)
             }
             
+    def _to_wall_clock(self, monotonic_ns: int) -> float:
+        """Convert a time.monotonic_ns() stamp to epoch seconds, keeping 0 for never"""
+        return self._wall_clock_offset + monotonic_ns / 1e9 if monotonic_ns else 0
+        
     # Service Management Methods
     
     def get_service_status(self) -> Dict:
@@ -347,6 +528,11 @@ class ServiceController:
             if not self.stop_market_view_monitoring():
                 success = False
                 
+            # Write the final state now; the writer thread is a daemon and
+            # may not get to a queued save before the process exits
+            with self._persist_lock:
+                self.persistence_manager.save_persistence_data()
+                
             self.logger.info("All services stopped")
             return success
             
@@ -354,6 +540,28 @@ class ServiceController:
             self.logger.error(f"Error stopping all services: {e}")
             return False
             
+    def close(self):
+        """
+        Stop all services and end the controller's background threads
+        
+        Pending state saves are written before this returns. The controller
+        must not be used afterwards; calling close again does nothing.
+        """
+        if self._closed:
+            return
+        self.stop_all_services()
+        self._closed = True
+        
+        # The writer saves whatever is still queued, then exits on the sentinel
+        self._persist_q.put(_CLOSE)
+        self._persist_thread.join()
+        
+        # Release the parked arbitrage thread so it can exit
+        if self.arbitrage_thread is not None:
+            self._arb_resume.set()
+            self.arbitrage_thread.join(timeout=5)
+        self.logger.info("Service controller closed")
+        
     def is_service_running(self, service_name: str) -> bool:
         """
         Check if a specific service is running
@@ -4,7 +4,8 @@ Test script for the Arbitrage Detection Module
 import sys
 import os
 import time
-from typing import Dict
+import asyncio
+from typing import Dict, List
 
 # Add src to path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -33,13 +34,10 @@ def test_threshold_configuration(detector: ArbitrageDetector):
     
     return True
 
-def test_arbitrage_detection(detector: ArbitrageDetector, fetcher: MarketDataFetcher):
+def test_arbitrage_detection(detector: ArbitrageDetector, all_symbols: Dict[str, List[str]]):
     """Test basic arbitrage detection"""
     print("\nTesting arbitrage detection...")
     
-    # Get some symbols to test with
-    all_symbols = fetcher.get_all_symbols()
-    
     if not all_symbols:
         print("  ❌ Cannot test arbitrage detection - failed to get symbols")
         return False
@@ -96,13 +94,10 @@ def test_synthetic_arbitrage_detection(detector: ArbitrageDetector, fetcher: Mar
     print("  ✅ Synthetic arbitrage detection test completed")
     return True
 
-def test_opportunity_tracking(detector: ArbitrageDetector, fetcher: MarketDataFetcher):
+def test_opportunity_tracking(detector: ArbitrageDetector, all_symbols: Dict[str, List[str]]):
     """Test opportunity tracking functionality"""
     print("\nTesting opportunity tracking...")
     
-    # Get some symbols to test with
-    all_symbols = fetcher.get_all_symbols()
-    
     if not all_symbols:
         print("  ❌ Cannot test opportunity tracking - failed to get symbols")
         return False
@@ -140,6 +135,20 @@ def test_opportunity_tracking(detector: ArbitrageDetector, fetcher: MarketDataFe
     print("  ✅ Opportunity tracking test completed")
     return True
 
+def run_test(test_func, *args):
+    """Run one test, returning its exception instead of raising it"""
+    try:
+        return test_func(*args)
+    except Exception as e:
+        return e
+
+async def run_tests_concurrently(tests):
+    """Run independent tests at the same time on worker threads"""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(loop.run_in_executor(None, run_test, test_func, *args) for _, test_func, *args in tests)
+    )
+
 def main():
     """Main test function"""
     print("Generic Trading Bot - Arbitrage Detection Module Test")
@@ -161,31 +170,37 @@ def main():
         print(f"⚠️  Warning: API keys not configured for {', '.join(missing_keys)}. Set API keys in .env file.")
         print("   Some tests may be skipped or limited.")
     
-    # Run tests
+    # Fetch the symbol lists once and share them between tests
+    all_symbols = fetcher.get_all_symbols()
+    
+    # Threshold configuration mutates the shared detector, so it runs first;
+    # the remaining tests are independent network-bound calls and run together
+    setup_tests = [
+        ("Threshold Configuration", test_threshold_configuration, detector)
+    ]
     tests = [
-        ("Threshold Configuration", test_threshold_configuration, detector),
-        ("Basic Arbitrage Detection", test_arbitrage_detection, detector, fetcher),
+        ("Basic Arbitrage Detection", test_arbitrage_detection, detector, all_symbols),
         ("Synthetic Arbitrage Detection", test_synthetic_arbitrage_detection, detector, fetcher),
-        ("Opportunity Tracking", test_opportunity_tracking, detector, fetcher)
+        ("Opportunity Tracking", test_opportunity_tracking, detector, all_symbols)
     ]
     
+    results = [run_test(test_func, *args) for _, test_func, *args in setup_tests]
+    results += asyncio.run(run_tests_concurrently(tests))
+    
     passed = 0
     total = 0
     
-    for test_info in tests:
+    for test_info, result in zip(setup_tests + tests, results):
         test_name = test_info[0]
-        test_func = test_info[1]
-        args = test_info[2:]
         
         total += 1
-        try:
-            if test_func(*args):
-                passed += 1
-                print(f"✅ {test_name} test passed")
-            else:
-                print(f"❌ {test_name} test failed")
-        except Exception as e:
-            print(f"❌ {test_name} test failed with exception: {e}")
+        if isinstance(result, Exception):
+            print(f"❌ {test_name} test failed with exception: {result}")
+        elif result:
+            passed += 1
+            print(f"✅ {test_name} test passed")
+        else:
+            print(f"❌ {test_name} test failed")
     
     print("\n" + "=" * 55)
     print(f"Test Results: {passed}/{total} tests passed")
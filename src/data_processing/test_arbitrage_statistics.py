@@ -3,20 +3,28 @@ Unit tests for the Arbitrage Statistics module
 """
 import unittest
 import os
+import sys
 import tempfile
 import shutil
 from datetime import datetime, timedelta
-import sys
-import os
+
+# Add src to path so the file also runs directly, outside pytest's conftest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from arbitrage_statistics import ArbitrageLogger, ArbitrageStatistics
+from data_processing.testing_utils import fast_tmpdir
+from data_processing.arbitrage_statistics import ArbitrageLogger, ArbitrageStatistics
 # We can't import ArbitrageOpportunity directly due to circular imports
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 @dataclass
 class ArbitrageOpportunity:
     """Represents an arbitrage opportunity"""
+    # Spelled out rather than dataclass(slots=True) to stay importable on
+    # Python < 3.10; no field has a default, so nothing clashes with a slot
+    __slots__ = ('symbol', 'buy_exchange', 'sell_exchange', 'buy_price', 'sell_price',
+                 'profit_percentage', 'profit_absolute', 'timestamp',
+                 'threshold_percentage', 'threshold_absolute')
+    
     symbol: str
     buy_exchange: str
     sell_exchange: str
@@ -28,191 +36,115 @@ class ArbitrageOpportunity:
     threshold_percentage: float
     threshold_absolute: float
 
+# Fixture timestamps are taken once at import so every test sees the same clock
+_NOW = datetime.now().timestamp()
+
+# Every fixture is the BTC template with a few fields swapped
+_TEMPLATE = ArbitrageOpportunity(
+    symbol="BTC-USDT",
+    buy_exchange="binance",
+    sell_exchange="okx",
+    buy_price=50000.0,
+    sell_price=50100.0,
+    profit_percentage=0.2,
+    profit_absolute=100.0,
+    timestamp=0.0,
+    threshold_percentage=0.1,
+    threshold_absolute=50.0
+)
+
+def _opp(**overrides) -> ArbitrageOpportunity:
+    """Build a fixture opportunity from the template"""
+    return replace(_TEMPLATE, **overrides)
+
+_BTC_OPP = _opp(timestamp=_NOW)
+_ETH_OPP = _opp(symbol="ETH-USDT", buy_exchange="okx", sell_exchange="bybit",
+                buy_price=3000.0, sell_price=3010.0, profit_percentage=0.33,
+                profit_absolute=10.0, timestamp=_NOW - 3600, threshold_absolute=5.0)
+_BTC_ALT_OPP = _opp(buy_exchange="bybit", sell_exchange="deribit",
+                    buy_price=49900.0, sell_price=50050.0, profit_percentage=0.3,
+                    profit_absolute=150.0, timestamp=_NOW - 7200)
+_LTC_OPP = _opp(symbol="LTC-USDT", sell_exchange="deribit",
+                buy_price=150.0, sell_price=151.0, profit_percentage=0.67,
+                profit_absolute=1.0, timestamp=_NOW - 86400, threshold_absolute=0.5)
+
+# Row count for the large-log variant of the time filtering test
+STRESS_ROWS = 20000
+
 class TestArbitrageStatistics(unittest.TestCase):
     """Test cases for ArbitrageLogger and statistics calculation"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one parent temp dir and the shared fixture list for the class"""
+        cls.class_dir = fast_tmpdir()
+        
+        # Opportunities spread over the last day, shared by the tests:
+        # the first three fall inside any window of 3 hours or more
+        cls.OPPS = [_BTC_OPP, _ETH_OPP, _BTC_ALT_OPP, _LTC_OPP]
+        
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the parent temp dir, and every per-test dir under it"""
+        shutil.rmtree(cls.class_dir, ignore_errors=True)
+        
     def setUp(self):
         """Set up test environment"""
         # Create a temporary directory for test data
-        self.test_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test environment"""
-        # Remove the temporary directory
-        shutil.rmtree(self.test_dir)
+        self.test_dir = tempfile.mkdtemp(dir=self.class_dir)
         
-    def test_sqlite_storage(self):
-        """Test SQLite storage functionality"""
-        # Initialize logger with SQLite storage
+    def test_sqlite_pragmas(self):
+        """Test SQLite connection is configured for WAL journaling"""
         logger = ArbitrageLogger(storage_type="sqlite", storage_path=self.test_dir)
         
-        # Create a test opportunity
-        opportunity = ArbitrageOpportunity(
-            symbol="BTC-USDT",
-            buy_exchange="binance",
-            sell_exchange="okx",
-            buy_price=50000.0,
-            sell_price=50100.0,
-            profit_percentage=0.2,
-            profit_absolute=100.0,
-            timestamp=datetime.now().timestamp(),
-            threshold_percentage=0.1,
-            threshold_absolute=50.0
-        )
-        
-        # Log the opportunity
-        logger.log_opportunity(opportunity)
-        
-        # Get statistics
-        stats = logger.get_statistics()
-        
-        # Verify statistics
-        self.assertEqual(stats.total_opportunities, 1)
-        self.assertEqual(stats.average_spread, 100.0)
-        self.assertEqual(stats.max_spread, 100.0)
-        self.assertIn("BTC-USDT", stats.opportunities_by_symbol)
-        self.assertEqual(stats.opportunities_by_symbol["BTC-USDT"], 1)
-        self.assertIn("binance-okx", stats.opportunities_by_exchange_pair)
-        self.assertEqual(stats.opportunities_by_exchange_pair["binance-okx"], 1)
+        cursor = logger.db_connection.cursor()
+        self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+        self.assertEqual(cursor.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
         
-        # Close the logger
         logger.close()
         
-    def test_csv_storage(self):
-        """Test CSV storage functionality"""
-        # Initialize logger with CSV storage
-        logger = ArbitrageLogger(storage_type="csv", storage_path=self.test_dir)
-        
-        # Create test opportunities
-        opportunities = [
-            ArbitrageOpportunity(
-                symbol="BTC-USDT",
-                buy_exchange="binance",
-                sell_exchange="okx",
-                buy_price=50000.0,
-                sell_price=50100.0,
-                profit_percentage=0.2,
-                profit_absolute=100.0,
-                timestamp=datetime.now().timestamp(),
-                threshold_percentage=0.1,
-                threshold_absolute=50.0
-            ),
-            ArbitrageOpportunity(
-                symbol="ETH-USDT",
-                buy_exchange="okx",
-                sell_exchange="bybit",
-                buy_price=3000.0,
-                sell_price=3010.0,
-                profit_percentage=0.33,
-                profit_absolute=10.0,
-                timestamp=datetime.now().timestamp(),
-                threshold_percentage=0.1,
-                threshold_absolute=5.0
-            )
-        ]
-        
-        # Log the opportunities
-        for opp in opportunities:
-            logger.log_opportunity(opp)
-        
-        # Get statistics
-        stats = logger.get_statistics()
-        
-        # Verify statistics
-        self.assertEqual(stats.total_opportunities, 2)
-        self.assertEqual(stats.average_spread, 55.0)  # (100 + 10) / 2
-        self.assertEqual(stats.max_spread, 100.0)
-        self.assertIn("BTC-USDT", stats.opportunities_by_symbol)
-        self.assertIn("ETH-USDT", stats.opportunities_by_symbol)
-        self.assertEqual(stats.opportunities_by_symbol["BTC-USDT"], 1)
-        self.assertEqual(stats.opportunities_by_symbol["ETH-USDT"], 1)
-        self.assertIn("binance-okx", stats.opportunities_by_exchange_pair)
-        self.assertIn("okx-bybit", stats.opportunities_by_exchange_pair)
-        self.assertEqual(stats.opportunities_by_exchange_pair["binance-okx"], 1)
-        self.assertEqual(stats.opportunities_by_exchange_pair["okx-bybit"], 1)
-        
-    def test_json_storage(self):
-        """Test JSON storage functionality"""
-        # Initialize logger with JSON storage
-        logger = ArbitrageLogger(storage_type="json", storage_path=self.test_dir)
-        
-        # Create a test opportunity
-        opportunity = ArbitrageOpportunity(
-            symbol="BTC-USDT",
-            buy_exchange="binance",
-            sell_exchange="okx",
-            buy_price=50000.0,
-            sell_price=50100.0,
-            profit_percentage=0.2,
-            profit_absolute=100.0,
-            timestamp=datetime.now().timestamp(),
-            threshold_percentage=0.1,
-            threshold_absolute=50.0
-        )
-        
-        # Log the opportunity
-        logger.log_opportunity(opportunity)
-        
-        # Get statistics
-        stats = logger.get_statistics()
-        
-        # Verify statistics
-        self.assertEqual(stats.total_opportunities, 1)
-        self.assertEqual(stats.average_spread, 100.0)
-        self.assertEqual(stats.max_spread, 100.0)
-        self.assertIn("BTC-USDT", stats.opportunities_by_symbol)
-        self.assertEqual(stats.opportunities_by_symbol["BTC-USDT"], 1)
-        self.assertIn("binance-okx", stats.opportunities_by_exchange_pair)
-        self.assertEqual(stats.opportunities_by_exchange_pair["binance-okx"], 1)
+    def test_storage_backends(self):
+        """Test SQLite, CSV and JSON storage give the same statistics"""
+        # Use two of the shared opportunities
+        opportunities = self.OPPS[:2]
+        
+        for backend in ("sqlite", "csv", "json"):
+            with self.subTest(backend=backend):
+                # Initialize logger with this backend in its own directory
+                storage_path = tempfile.mkdtemp(dir=self.test_dir)
+                logger = ArbitrageLogger(storage_type=backend, storage_path=storage_path)
+                self.addCleanup(logger.close)
+                
+                # Log the opportunities in one batch
+                logger.log_opportunities(opportunities)
+                
+                # Get statistics
+                stats = logger.get_statistics()
+                
+                # Verify statistics
+                self.assertEqual(stats.total_opportunities, 2)
+                self.assertEqual(stats.average_spread, 55.0)  # (100 + 10) / 2
+                self.assertEqual(stats.max_spread, 100.0)
+                self.assertEqual(stats.opportunities_by_symbol, {"BTC-USDT": 1, "ETH-USDT": 1})
+                self.assertEqual(stats.opportunities_by_exchange_pair, {"binance-okx": 1, "okx-bybit": 1})
+                logger.close()
+                
+                # Closing must leave everything on disk for a fresh reader
+                reopened = ArbitrageLogger(storage_type=backend, storage_path=storage_path)
+                self.addCleanup(reopened.close)
+                self.assertEqual(reopened.get_statistics().total_opportunities, 2)
         
     def test_symbol_filtering(self):
         """Test statistics filtering by symbol"""
         # Initialize logger with SQLite storage
         logger = ArbitrageLogger(storage_type="sqlite", storage_path=self.test_dir)
         
-        # Create test opportunities with different symbols
-        opportunities = [
-            ArbitrageOpportunity(
-                symbol="BTC-USDT",
-                buy_exchange="binance",
-                sell_exchange="okx",
-                buy_price=50000.0,
-                sell_price=50100.0,
-                profit_percentage=0.2,
-                profit_absolute=100.0,
-                timestamp=datetime.now().timestamp(),
-                threshold_percentage=0.1,
-                threshold_absolute=50.0
-            ),
-            ArbitrageOpportunity(
-                symbol="ETH-USDT",
-                buy_exchange="okx",
-                sell_exchange="bybit",
-                buy_price=3000.0,
-                sell_price=3010.0,
-                profit_percentage=0.33,
-                profit_absolute=10.0,
-                timestamp=datetime.now().timestamp(),
-                threshold_percentage=0.1,
-                threshold_absolute=5.0
-            ),
-            ArbitrageOpportunity(
-                symbol="BTC-USDT",
-                buy_exchange="bybit",
-                sell_exchange="deribit",
-                buy_price=49900.0,
-                sell_price=50050.0,
-                profit_percentage=0.3,
-                profit_absolute=150.0,
-                timestamp=datetime.now().timestamp(),
-                threshold_percentage=0.1,
-                threshold_absolute=50.0
-            )
-        ]
+        # Use the shared opportunities from the last few hours (mixed symbols)
+        opportunities = self.OPPS[:3]
         
-        # Log the opportunities
-        for opp in opportunities:
-            logger.log_opportunity(opp)
+        # Log the opportunities in one batch
+        logger.log_opportunities(opportunities)
         
         # Get statistics for BTC-USDT only
         stats = logger.get_statistics(symbol="BTC-USDT")
@@ -233,66 +165,8 @@ class TestArbitrageStatistics(unittest.TestCase):
         # Initialize logger with SQLite storage
         logger = ArbitrageLogger(storage_type="sqlite", storage_path=self.test_dir)
         
-        # Create test opportunities with different timestamps
-        now = datetime.now().timestamp()
-        one_hour_ago = now - 3600
-        two_hours_ago = now - 7200
-        one_day_ago = now - 86400
-        
-        opportunities = [
-            ArbitrageOpportunity(
-                symbol="BTC-USDT",
-                buy_exchange="binance",
-                sell_exchange="okx",
-                buy_price=50000.0,
-                sell_price=50100.0,
-                profit_percentage=0.2,
-                profit_absolute=100.0,
-                timestamp=now,
-                threshold_percentage=0.1,
-                threshold_absolute=50.0
-            ),
-            ArbitrageOpportunity(
-                symbol="ETH-USDT",
-                buy_exchange="okx",
-                sell_exchange="bybit",
-                buy_price=3000.0,
-                sell_price=3010.0,
-                profit_percentage=0.33,
-                profit_absolute=10.0,
-                timestamp=one_hour_ago,
-                threshold_percentage=0.1,
-                threshold_absolute=5.0
-            ),
-            ArbitrageOpportunity(
-                symbol="BTC-USDT",
-                buy_exchange="bybit",
-                sell_exchange="deribit",
-                buy_price=49900.0,
-                sell_price=50050.0,
-                profit_percentage=0.3,
-                profit_absolute=150.0,
-                timestamp=two_hours_ago,
-                threshold_percentage=0.1,
-                threshold_absolute=50.0
-            ),
-            ArbitrageOpportunity(
-                symbol="LTC-USDT",
-                buy_exchange="binance",
-                sell_exchange="deribit",
-                buy_price=150.0,
-                sell_price=151.0,
-                profit_percentage=0.67,
-                profit_absolute=1.0,
-                timestamp=one_day_ago,
-                threshold_percentage=0.1,
-                threshold_absolute=0.5
-            )
-        ]
-        
-        # Log the opportunities
-        for opp in opportunities:
-            logger.log_opportunity(opp)
+        # Log all shared opportunities, spread over the last day
+        logger.log_opportunities(self.OPPS)
         
         # Get statistics for last 3 hours (should exclude the one from a day ago)
         stats = logger.get_statistics(hours=3)
@@ -307,6 +181,40 @@ class TestArbitrageStatistics(unittest.TestCase):
         
         # Close the logger
         logger.close()
+        
+    def test_time_filtering_stress(self):
+        """Test time filtering stays exact over a large SQLite log"""
+        logger = ArbitrageLogger(storage_type="sqlite", storage_path=self.test_dir)
+        
+        # Alternate the recent and day-old fixtures so half fall in the window
+        logger.log_opportunities(
+            self.OPPS[0] if i % 2 else self.OPPS[3]
+            for i in range(STRESS_ROWS)
+        )
+        
+        stats = logger.get_statistics(hours=3)
+        
+        self.assertEqual(stats.total_opportunities, STRESS_ROWS // 2)
+        self.assertEqual(stats.average_spread, 100.0)
+        self.assertEqual(stats.max_spread, 100.0)
+        self.assertEqual(stats.opportunities_by_symbol, {"BTC-USDT": STRESS_ROWS // 2})
+        
+        logger.close()
+        
+    def test_json_lines_storage(self):
+        """Test the JSON backend skips a torn last line and keeps appending after it"""
+        logger = ArbitrageLogger(storage_type="json", storage_path=self.test_dir)
+        logger.log_opportunities(self.OPPS[:2])
+        logger.close()
+        
+        # Simulate a crash part-way through writing a record
+        with open(os.path.join(self.test_dir, "arbitrage_opportunities.jsonl"), 'a') as f:
+            f.write('{"timestamp": ')
+            
+        reopened = ArbitrageLogger(storage_type="json", storage_path=self.test_dir)
+        reopened.log_opportunity(self.OPPS[2])
+        self.assertEqual(reopened.get_statistics().total_opportunities, 3)
+        reopened.close()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
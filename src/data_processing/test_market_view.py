@@ -12,13 +12,28 @@ from config.config_manager import ConfigManager
 from data_acquisition.market_data_fetcher import MarketDataFetcher
 from data_processing.market_view import MarketViewManager
 
-def test_market_data_fetching(manager: MarketViewManager, fetcher: MarketDataFetcher):
+class FakeFetcher:
+    """Offline stand-in for MarketDataFetcher, selected with --mock"""
+    
+    def get_all_symbols(self):
+        return {"binance": ["BTC-USDT"], "okx": ["BTC-USDT"]}
+        
+    def get_l1_market_data(self, exchange: str, symbol: str):
+        # Quote the two venues slightly apart so the CBBO picks a side
+        offset = 5.0 if exchange == "okx" else 0.0
+        return {
+            'symbol': symbol,
+            'bid_price': 50000.0 + offset,
+            'ask_price': 50010.0 + offset,
+            'bid_size': 1.0,
+            'ask_size': 1.0,
+            'timestamp': time.time()
+        }
+
+def test_market_data_fetching(manager: MarketViewManager, all_symbols: dict):
     """Test market data fetching functionality"""
     print("Testing market data fetching...")
     
-    # Get some symbols to test with
-    all_symbols = fetcher.get_all_symbols()
-    
     if not all_symbols:
         print("❌ Cannot test market data fetching - failed to get symbols")
         return False
@@ -50,13 +65,10 @@ def test_market_data_fetching(manager: MarketViewManager, fetcher: MarketDataFet
     
     return True
 
-def test_consolidated_market_view(manager: MarketViewManager, fetcher: MarketDataFetcher):
+def test_consolidated_market_view(manager: MarketViewManager, all_symbols: dict):
     """Test consolidated market view functionality"""
     print("\nTesting consolidated market view...")
     
-    # Get some symbols to test with
-    all_symbols = fetcher.get_all_symbols()
-    
     if not all_symbols:
         print("❌ Cannot test consolidated market view - failed to get symbols")
         return False
@@ -93,13 +105,10 @@ def test_consolidated_market_view(manager: MarketViewManager, fetcher: MarketDat
     
     return True
 
-def test_cbbo(manager: MarketViewManager, fetcher: MarketDataFetcher):
+def test_cbbo(manager: MarketViewManager, all_symbols: dict):
     """Test CBBO functionality"""
     print("\nTesting CBBO functionality...")
     
-    # Get some symbols to test with
-    all_symbols = fetcher.get_all_symbols()
-    
     if not all_symbols:
         print("❌ Cannot test CBBO - failed to get symbols")
         return False
@@ -147,39 +156,43 @@ def main():
     print("Generic Trading Bot - Market View Module Test")
     print("=" * 45)
     
-    # Initialize components
-    config = ConfigManager()
-    fetcher = MarketDataFetcher(config)
+    # Initialize components; --mock swaps in an offline fetcher
+    if "--mock" in sys.argv[1:]:
+        print("Running against FakeFetcher (no network)")
+        fetcher = FakeFetcher()
+    else:
+        config = ConfigManager()
+        fetcher = MarketDataFetcher(config)
+        
+        # Check if exchange API keys are configured
+        missing_keys = []
+        if not config.binance_api_key:
+            missing_keys.append('Binance')
+        if not config.okx_api_key:
+            missing_keys.append('OKX')
+        
+        if missing_keys:
+            print(f"⚠️  Warning: API keys not configured for {', '.join(missing_keys)}. Set API keys in .env file.")
+            print("   Some tests may be skipped or limited.")
     manager = MarketViewManager(fetcher)
     
-    # Check if exchange API keys are configured
-    missing_keys = []
-    if not config.binance_api_key:
-        missing_keys.append('Binance')
-    if not config.okx_api_key:
-        missing_keys.append('OKX')
-    
-    if missing_keys:
-        print(f"⚠️  Warning: API keys not configured for {', '.join(missing_keys)}. Set API keys in .env file.")
-        print("   Some tests may be skipped or limited.")
+    # Fetch the symbol listing once and share it across the tests
+    all_symbols = fetcher.get_all_symbols()
     
     # Run tests
     tests = [
-        ("Market Data Fetching", test_market_data_fetching, manager, fetcher),
-        ("Consolidated Market View", test_consolidated_market_view, manager, fetcher),
-        ("CBBO Functionality", test_cbbo, manager, fetcher),
+        ("Market Data Fetching", test_market_data_fetching, manager, all_symbols),
+        ("Consolidated Market View", test_consolidated_market_view, manager, all_symbols),
+        ("CBBO Functionality", test_cbbo, manager, all_symbols),
         ("Monitoring Status", test_monitoring_status, manager)
     ]
     
     passed = 0
-    total = 0
+    total = len(tests)
     
-    for test_info in tests:
-        test_name = test_info[0]
-        test_func = test_info[1]
-        args = test_info[2:]
-        
-        total += 1
+    # The tests share one manager and print as they go, so run them in turn;
+    # each one's exchange requests still fan out on the manager's pool
+    for test_name, test_func, *args in tests:
         try:
             if test_func(*args):
                 passed += 1
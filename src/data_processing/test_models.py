@@ -0,0 +1,65 @@
+"""
+Unit tests for the Data Models module
+"""
+import copy
+import os
+import pickle
+import sys
+import unittest
+
+# Add src to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from data_processing.models import ArbitrageOpportunity, ConsolidatedMarketView, MarketViewData
+
+_MARKET_DATA = MarketViewData(
+    symbol="BTC-USDT",
+    exchange="binance",
+    bid_price=50000.0,
+    ask_price=50010.0,
+    bid_size=1.5,
+    ask_size=2.0,
+    timestamp=1700000000.0
+)
+
+_CONSOLIDATED = ConsolidatedMarketView(
+    symbol="BTC-USDT",
+    exchanges_data={"binance": _MARKET_DATA},
+    cbbo_bid_exchange="binance",
+    cbbo_ask_exchange="binance",
+    cbbo_bid_price=50000.0,
+    cbbo_ask_price=50010.0,
+    timestamp=1700000000.0
+)
+
+_OPPORTUNITY = ArbitrageOpportunity(
+    symbol="BTC-USDT",
+    buy_exchange="binance",
+    sell_exchange="okx",
+    buy_price=50000.0,
+    sell_price=50100.0,
+    profit_percentage=0.2,
+    profit_absolute=100.0,
+    timestamp=1700000000.0,
+    threshold_percentage=0.1,
+    threshold_absolute=50.0
+)
+
+class TestFrozenModels(unittest.TestCase):
+    """Test the frozen, slotted per-tick models"""
+
+    def test_copy_and_pickle_round_trip(self):
+        """Copies and unpickled instances compare equal to the original"""
+        for model in (_MARKET_DATA, _CONSOLIDATED, _OPPORTUNITY):
+            with self.subTest(model=type(model).__name__):
+                self.assertEqual(copy.copy(model), model)
+                self.assertEqual(copy.deepcopy(model), model)
+                self.assertEqual(pickle.loads(pickle.dumps(model)), model)
+
+    def test_deepcopy_copies_nested_data(self):
+        """A deep copy does not share the exchanges_data dict"""
+        clone = copy.deepcopy(_CONSOLIDATED)
+        self.assertIsNot(clone.exchanges_data, _CONSOLIDATED.exchanges_data)
+
+if __name__ == '__main__':
+    unittest.main()
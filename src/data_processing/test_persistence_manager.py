@@ -3,30 +3,55 @@ Unit tests for the Persistence Manager module
 """
 import unittest
 import os
+import sys
 import tempfile
 import shutil
 import json
 from datetime import datetime
-import sys
-import os
+
+# Add src to path so the file also runs directly, outside pytest's conftest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from persistence_manager import PersistenceManager
+from data_processing.testing_utils import fast_tmpdir
+from data_processing.persistence_manager import PersistenceManager
+
+# Persistence file contents written before the backup test's first save,
+# serialized once at import
+_INITIAL_DATA = {
+    "arbitrage_monitoring": {
+        "active": True,
+        "assets": {"BTC-USDT": ["binance", "okx"]},
+        "thresholds": {"percentage": 0.5, "absolute": 1.0},
+        "start_time": "2023-01-01T00:00:00"
+    },
+    "market_view_monitoring": {
+        "active": False,
+        "symbols": {},
+        "start_time": None
+    },
+    "last_updated": "2023-01-01T00:00:00"
+}
+_INITIAL_BYTES = json.dumps(_INITIAL_DATA).encode('utf-8')
 
 class TestPersistenceManager(unittest.TestCase):
     """Test cases for PersistenceManager"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one parent temp dir for the class"""
+        cls.class_dir = fast_tmpdir()
+        
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the parent temp dir, and every per-test dir under it"""
+        shutil.rmtree(cls.class_dir, ignore_errors=True)
+        
     def setUp(self):
         """Set up test environment"""
         # Create a temporary directory for test data
-        self.test_dir = tempfile.mkdtemp()
+        self.test_dir = tempfile.mkdtemp(dir=self.class_dir)
         self.persistence_file = os.path.join(self.test_dir, "test_persistence.json")
         
-    def tearDown(self):
-        """Clean up test environment"""
-        # Remove the temporary directory
-        shutil.rmtree(self.test_dir)
-        
     def test_initialization(self):
         """Test PersistenceManager initialization"""
         # Initialize persistence manager
@@ -159,23 +184,8 @@ class TestPersistenceManager(unittest.TestCase):
     def test_file_backup(self):
         """Test file backup functionality"""
         # Create initial data file
-        initial_data = {
-            "arbitrage_monitoring": {
-                "active": True,
-                "assets": {"BTC-USDT": ["binance", "okx"]},
-                "thresholds": {"percentage": 0.5, "absolute": 1.0},
-                "start_time": "2023-01-01T00:00:00"
-            },
-            "market_view_monitoring": {
-                "active": False,
-                "symbols": {},
-                "start_time": None
-            },
-            "last_updated": "2023-01-01T00:00:00"
-        }
-        
-        with open(self.persistence_file, 'w') as f:
-            json.dump(initial_data, f)
+        with open(self.persistence_file, 'wb') as f:
+            f.write(_INITIAL_BYTES)
             
         # Initialize persistence manager
         pm = PersistenceManager(self.persistence_file)
@@ -188,11 +198,9 @@ class TestPersistenceManager(unittest.TestCase):
         backup_file = f"{self.persistence_file}.backup"
         self.assertTrue(os.path.exists(backup_file))
         
-        # Verify backup content matches original data
-        with open(backup_file, 'r') as f:
-            backup_data = json.load(f)
-            
-        self.assertEqual(backup_data, initial_data)
+        # Verify backup content matches original data byte for byte
+        with open(backup_file, 'rb') as f:
+            self.assertEqual(f.read(), _INITIAL_BYTES)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
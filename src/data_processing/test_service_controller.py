@@ -1,125 +1,67 @@
 """
-Test script for the Service Controller
-"""
-import sys
-import os
-import time
-import threading
-
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+Tests for the Service Controller
 
-from config.config_manager import ConfigManager
-from data_acquisition.market_data_fetcher import MarketDataFetcher
-from data_processing.service_controller import ServiceController
+Run with pytest (``pytest -q --no-header`` keeps the output to one
+line); the idle_controller and service_controller fixtures come from
+conftest.py.
+"""
+import pytest
 
-def test_service_controller_creation():
+def test_service_controller_creation(idle_controller):
     """Test service controller creation"""
-    print("Testing service controller creation...")
-    
-    # Create required components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
-    service_controller = ServiceController(market_fetcher, config)
-    
     # Check that services are initialized
-    assert service_controller.arbitrage_detector is not None
-    assert service_controller.market_view_manager is not None
-    assert not service_controller.arbitrage_monitoring
-    assert not service_controller.market_view_monitoring
-    
-    print("  ✅ Service controller created successfully")
-    print("  ✅ Arbitrage detector initialized")
-    print("  ✅ Market view manager initialized")
-    print("  ✅ Services are not running by default")
-    
-    return True
-
-def test_arbitrage_service_control():
-    """Test arbitrage service start/stop functionality"""
-    print("\nTesting arbitrage service control...")
-    
-    # Create required components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
-    service_controller = ServiceController(market_fetcher, config)
-    
-    # Test starting arbitrage monitoring
-    asset_exchanges = {
-        'BTC-USDT': ['binance', 'okx'],
-        'ETH-USDT': ['binance', 'bybit']
-    }
-    
-    success = service_controller.start_arbitrage_monitoring(asset_exchanges, 0.5, 1.0)
-    assert success
-    assert service_controller.arbitrage_monitoring
-    assert service_controller.arbitrage_assets == asset_exchanges
-    
-    print("  ✅ Arbitrage monitoring started successfully")
-    
-    # Test getting arbitrage status
-    status = service_controller.get_arbitrage_status()
-    assert status['monitoring']
-    assert status['monitored_assets'] == asset_exchanges
-    
-    print("  ✅ Arbitrage status retrieved successfully")
-    
-    # Test stopping arbitrage monitoring
-    success = service_controller.stop_arbitrage_monitoring()
-    assert success
-    assert not service_controller.arbitrage_monitoring
-    
-    print("  ✅ Arbitrage monitoring stopped successfully")
-    
-    return True
+    assert idle_controller.arbitrage_detector is not None
+    assert idle_controller.market_view_manager is not None
+    assert not idle_controller.arbitrage_monitoring
+    assert not idle_controller.market_view_monitoring
 
-def test_market_view_service_control():
-    """Test market view service start/stop functionality"""
-    print("\nTesting market view service control...")
-    
-    # Create required components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
-    service_controller = ServiceController(market_fetcher, config)
-    
-    # Test starting market view monitoring
+@pytest.mark.parametrize(
+    "kind, start, stop, get_status, tracked_attr, status_key, extra_args",
+    [
+        ("arbitrage", "start_arbitrage_monitoring", "stop_arbitrage_monitoring",
+         "get_arbitrage_status", "arbitrage_assets", "monitored_assets", (0.5, 1.0)),
+        ("market_view", "start_market_view_monitoring", "stop_market_view_monitoring",
+         "get_market_view_status", "market_view_symbols", "monitored_symbols", ()),
+    ],
+    ids=["arbitrage", "market_view"]
+)
+def test_service_control(service_controller, kind, start, stop, get_status,
+                         tracked_attr, status_key, extra_args):
+    """Test start/stop functionality of the arbitrage and market view services"""
+    # Test starting monitoring
     symbol_exchanges = {
         'BTC-USDT': ['binance', 'okx'],
         'ETH-USDT': ['binance', 'bybit']
     }
     
-    success = service_controller.start_market_view_monitoring(symbol_exchanges)
+    success = getattr(service_controller, start)(symbol_exchanges, *extra_args)
     assert success
-    assert service_controller.market_view_monitoring
-    assert service_controller.market_view_symbols == symbol_exchanges
+    assert getattr(service_controller, f"{kind}_monitoring")
+    assert getattr(service_controller, tracked_attr) == symbol_exchanges
     
-    print("  ✅ Market view monitoring started successfully")
-    
-    # Test getting market view status
-    status = service_controller.get_market_view_status()
+    # Test getting service status
+    status = getattr(service_controller, get_status)()
     assert status['monitoring']
-    assert status['monitored_symbols'] == symbol_exchanges
-    
-    print("  ✅ Market view status retrieved successfully")
+    assert status[status_key] == symbol_exchanges
     
-    # Test stopping market view monitoring
-    success = service_controller.stop_market_view_monitoring()
+    # Test stopping monitoring
+    success = getattr(service_controller, stop)()
     assert success
-    assert not service_controller.market_view_monitoring
-    
-    print("  ✅ Market view monitoring stopped successfully")
+    assert not getattr(service_controller, f"{kind}_monitoring")
+
+def test_status_cache(service_controller):
+    """Test cached statuses are private to each caller and dropped on stop"""
+    status = service_controller.get_arbitrage_status()
+    status['thresholds']['percentage'] = -1.0
+    assert service_controller.get_arbitrage_status()['thresholds']['percentage'] != -1.0
     
-    return True
+    service_controller.start_arbitrage_monitoring({'BTC-USDT': ['binance', 'okx']})
+    assert service_controller.get_arbitrage_status()['monitoring']
+    service_controller.stop_arbitrage_monitoring()
+    assert not service_controller.get_arbitrage_status()['monitoring']
 
-def test_concurrent_services():
+def test_concurrent_services(service_controller):
     """Test that both services can run concurrently"""
-    print("\nTesting concurrent service operation...")
-    
-    # Create required components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
-    service_controller = ServiceController(market_fetcher, config)
-    
     # Start both services
     asset_exchanges = {'BTC-USDT': ['binance', 'okx']}
     symbol_exchanges = {'ETH-USDT': ['binance', 'bybit']}
@@ -132,8 +74,6 @@ def test_concurrent_services():
     assert service_controller.arbitrage_monitoring
     assert service_controller.market_view_monitoring
     
-    print("  ✅ Both services started successfully")
-    
     # Check that both services are running
     arb_status = service_controller.get_arbitrage_status()
     mv_status = service_controller.get_market_view_status()
@@ -141,28 +81,15 @@ def test_concurrent_services():
     assert arb_status['monitoring']
     assert mv_status['monitoring']
     
-    print("  ✅ Both services are running concurrently")
-    
     # Stop both services
     service_controller.stop_all_services()
     assert not service_controller.arbitrage_monitoring
     assert not service_controller.market_view_monitoring
-    
-    print("  ✅ Both services stopped successfully")
-    
-    return True
 
-def test_service_status():
+def test_service_status(idle_controller):
     """Test overall service status reporting"""
-    print("\nTesting service status reporting...")
-    
-    # Create required components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
-    service_controller = ServiceController(market_fetcher, config)
-    
     # Get overall status
-    status = service_controller.get_service_status()
+    status = idle_controller.get_service_status()
     
     assert 'arbitrage_service' in status
     assert 'market_view_service' in status
@@ -173,45 +100,3 @@ def test_service_status():
     
     assert not arb_status['monitoring']
     assert not mv_status['monitoring']
-    
-    print("  ✅ Overall service status retrieved successfully")
-    
-    return True
-
-def run_all_tests():
-    """Run all tests for the service controller"""
-    print("Generic Trading Bot - Service Controller Test")
-    print("=" * 50)
-    
-    tests = [
-        test_service_controller_creation,
-        test_arbitrage_service_control,
-        test_market_view_service_control,
-        test_concurrent_services,
-        test_service_status
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            test()
-            passed += 1
-            print(f"✅ {test.__name__} passed")
-        except Exception as e:
-            failed += 1
-            print(f"❌ {test.__name__} failed: {e}")
-    
-    print("=" * 50)
-    print(f"Test Results: {passed}/{passed + failed} tests passed")
-    
-    if failed == 0:
-        print("🎉 All tests passed!")
-        return True
-    else:
-        print(f"❌ {failed} tests failed")
-        return False
-
-if __name__ == "__main__":
-    run_all_tests()
\ No newline at end of file
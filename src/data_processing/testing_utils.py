@@ -0,0 +1,21 @@
+"""
+Helpers shared by the data processing tests
+
+Plain module with no pytest dependency, so the unittest scripts can import it
+when run directly.
+"""
+import os
+import tempfile
+
+# Prefer RAM-backed tmpfs for test files: the statistics tests commit SQLite
+# transactions and the persistence tests fsync their JSON state file, and on
+# tmpfs neither waits on the disk. Falls back to the default temp dir
+SYSTEM_SHARED_MEM_FS = "/dev/shm"
+
+def fast_tmpdir() -> str:
+    """Create a temporary directory, on tmpfs when it is available"""
+    # Tag the directory with the pid so parallel workers are easy to tell apart
+    prefix = f"t_{os.getpid()}_"
+    if os.path.isdir(SYSTEM_SHARED_MEM_FS) and os.access(SYSTEM_SHARED_MEM_FS, os.W_OK):
+        return tempfile.mkdtemp(prefix=prefix, dir=SYSTEM_SHARED_MEM_FS)
+    return tempfile.mkdtemp(prefix=prefix)
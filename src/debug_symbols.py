@@ -1,14 +1,8 @@
 """
 Debug script to check symbol data structure
 """
-import sys
-import os
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
-from config.config_manager import ConfigManager
-from data_acquisition.market_data_fetcher import MarketDataFetcher
+from data_acquisition.market_data_fetcher import get_market_fetcher
 
 def debug_symbols():
     """Debug symbol data structure"""
@@ -16,24 +10,21 @@ def debug_symbols():
     print("=" * 35)
     
     # Initialize components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
+    market_fetcher = get_market_fetcher()
     
-    # Get available symbols
+    # Only the first exchange is inspected, so stop fetching after it
     print("\n1. Discovering available symbols...")
-    all_symbols = market_fetcher.get_all_symbols()
+    first = next(market_fetcher.iter_symbols_per_exchange(), None)
     
-    if not all_symbols:
+    if first is None:
         print("❌ Failed to retrieve symbols.")
         return
         
-    print(f"✅ Retrieved symbols from {len(all_symbols)} exchanges:")
-    for exchange, symbols in all_symbols.items():
-        print(f"   {exchange}: {len(symbols)} symbols")
-        if symbols:
-            print(f"     First symbol type: {type(symbols[0])}")
-            print(f"     First symbol value: {symbols[0]}")
-        break  # Just check the first exchange
+    exchange, symbols = first
+    print(f"✅ Retrieved symbols from {exchange}:")
+    print(f"   {exchange}: {len(symbols)} symbols")
+    print(f"     First symbol type: {type(symbols[0])}")
+    print(f"     First symbol value: {symbols[0]}")
 
 if __name__ == "__main__":
     debug_symbols()
\ No newline at end of file
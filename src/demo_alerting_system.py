@@ -2,20 +2,16 @@
 Demo script for the Alerting System
 This script demonstrates the alerting capabilities of the Telegram bot.
 """
-import sys
-import os
 import time
 import logging
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
-from telegram_bot.alert_manager import AlertManager
-from data_processing.arbitrage_detector import ArbitrageOpportunity
-from data_processing.market_view import ConsolidatedMarketView
-
 def demo_alert_formatting():
     """Demonstrate alert formatting"""
+    # Only this demo needs the telegram stack and the models; import them
+    # here so the print-only demos start without loading them
+    from telegram_bot.alert_manager import AlertManager
+    from data_processing.models import ArbitrageOpportunity, ConsolidatedMarketView
+    
     print("Generic Trading Bot - Alerting System Demo")
     print("=" * 45)
     
@@ -2,16 +2,14 @@
 Demo script for the Arbitrage Detection Module
 This script demonstrates the complete functionality of the arbitrage detection system.
 """
-import sys
-import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
-from config.config_manager import ConfigManager
-from data_acquisition.market_data_fetcher import MarketDataFetcher
+from config.config_manager import get_config
+from data_acquisition.market_data_fetcher import get_market_fetcher
+from data_acquisition.recording import demo_cassette
+from data_acquisition.symbol_cache import get_all_symbols_cached
 from data_processing.arbitrage_detector import ArbitrageDetector
 
 def setup_logging():
@@ -27,8 +25,8 @@ def demo_arbitrage_detection():
     print("=" * 50)
     
     # Initialize components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
+    config = get_config()
+    market_fetcher = get_market_fetcher()
     arbitrage_detector = ArbitrageDetector(market_fetcher, config)
     
     # Set initial thresholds
@@ -41,7 +39,7 @@ def demo_arbitrage_detection():
     
     # Get available symbols
     print("\n1. Discovering available symbols...")
-    all_symbols = market_fetcher.get_all_symbols()
+    all_symbols = get_all_symbols_cached(market_fetcher)
     
     if not all_symbols:
         print("❌ Failed to retrieve symbols. Please check your exchange API configuration.")
@@ -51,15 +49,16 @@ def demo_arbitrage_detection():
     for exchange, symbols in all_symbols.items():
         print(f"   {exchange}: {len(symbols)} symbols")
         
-    # Select symbols for testing
-    test_symbols = []
+    # Select symbols for testing; dict keys keep them unique and in listing
+    # order, so repeated runs pick the same symbols
+    test_symbols = {}
     for exchange, symbols in all_symbols.items():
         if symbols:
-            test_symbols.extend(symbols[:2])  # Take up to 2 symbols per exchange
-        if len(test_symbols) >= 4:  # Test with up to 4 symbols
+            test_symbols.update(dict.fromkeys(symbols[:2]))  # Take up to 2 symbols per exchange
+        if len(test_symbols) >= 2:  # Stop once there are 2 unique symbols
             break
             
-    test_symbols = list(set(test_symbols))[:2]  # Ensure unique symbols, max 2
+    test_symbols = list(test_symbols)[:2]  # Max 2 symbols
     
     if not test_symbols:
         print("❌ No test symbols available.")
@@ -69,11 +68,15 @@ def demo_arbitrage_detection():
     
     # Test basic arbitrage detection
     print("\n3. Testing basic arbitrage detection...")
-    for symbol in test_symbols:
-        opportunities = arbitrage_detector.find_arbitrage_opportunities(
-            ['binance', 'okx', 'bybit', 'deribit'], 
-            symbol
+    # Fetch every symbol's quotes concurrently, then report in order
+    exchanges = ['binance', 'okx', 'bybit', 'deribit']
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = arbitrage_detector.find_arbitrage_opportunities_batch(
+            {symbol: exchanges for symbol in test_symbols},
+            executor=executor
         )
+    for symbol in test_symbols:
+        opportunities = results.get(symbol, [])
         print(f"   {symbol}: Found {len(opportunities)} opportunities")
         
         # Display first opportunity if any found
@@ -141,4 +144,5 @@ def demo_arbitrage_detection():
 
 if __name__ == "__main__":
     setup_logging()
-    demo_arbitrage_detection()
\ No newline at end of file
+    with demo_cassette("demo_arbitrage_detection"):
+        demo_arbitrage_detection()
\ No newline at end of file
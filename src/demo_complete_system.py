@@ -2,16 +2,14 @@
 Demo script for the complete Generic Trading Bot system
 This script demonstrates the integration of arbitrage detection and market view functionality.
 """
-import sys
-import os
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
-from config.config_manager import ConfigManager
-from data_acquisition.market_data_fetcher import MarketDataFetcher
+from config.config_manager import get_config
+from data_acquisition.market_data_fetcher import get_market_fetcher
+from data_acquisition.recording import demo_cassette
+from data_acquisition.symbol_cache import get_all_symbols_cached
 from data_processing.arbitrage_detector import ArbitrageDetector
 from data_processing.market_view import MarketViewManager
 
@@ -28,8 +26,8 @@ def demo_complete_system():
     print("=" * 45)
     
     # Initialize components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
+    config = get_config()
+    market_fetcher = get_market_fetcher()
     arbitrage_detector = ArbitrageDetector(market_fetcher, config)
     market_view_manager = MarketViewManager(market_fetcher)
     
@@ -40,7 +38,7 @@ def demo_complete_system():
     
     # Get available symbols
     print("\n1. Discovering available symbols...")
-    all_symbols = market_fetcher.get_all_symbols()
+    all_symbols = get_all_symbols_cached(market_fetcher)
     
     if not all_symbols:
         print("❌ Failed to retrieve symbols. Please check your exchange API configuration.")
@@ -50,20 +48,21 @@ def demo_complete_system():
     for exchange, symbols in all_symbols.items():
         print(f"   {exchange}: {len(symbols)} symbols")
         
-    # Select symbols for testing
-    test_symbols = []
+    # Select symbols for testing; dict keys keep them unique and in listing
+    # order, so repeated runs pick the same symbols
+    test_symbols = {}
     test_exchanges = []
     
     for exchange, symbols in all_symbols.items():
         if symbols:
             # Extract symbol names - symbols are strings, not dictionaries
             symbol_names = symbols[:2]  # Take up to 2 symbols per exchange
-            test_symbols.extend(symbol_names)
+            test_symbols.update(dict.fromkeys(symbol_names))
             test_exchanges.append(exchange)
         if len(test_symbols) >= 2 and len(test_exchanges) >= 2:  # Test with up to 2 symbols and 2 exchanges
             break
             
-    test_symbols = list(set(test_symbols))[:2]  # Ensure unique symbols, max 2
+    test_symbols = list(test_symbols)[:2]  # Max 2 symbols
     
     if not test_symbols or not test_exchanges:
         print("❌ No test symbols/exchanges available.")
@@ -74,8 +73,14 @@ def demo_complete_system():
     
     # Test arbitrage detection
     print("\n3. Testing arbitrage detection...")
+    # Fetch every symbol's quotes concurrently, then report in order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = arbitrage_detector.find_arbitrage_opportunities_batch(
+            {symbol: test_exchanges for symbol in test_symbols},
+            executor=executor
+        )
     for symbol in test_symbols:
-        opportunities = arbitrage_detector.find_arbitrage_opportunities(test_exchanges, symbol)
+        opportunities = results.get(symbol, [])
         print(f"   {symbol}: Found {len(opportunities)} opportunities")
         
         # Display first opportunity if any found
@@ -87,8 +92,13 @@ def demo_complete_system():
     
     # Test market view
     print("\n4. Testing market view...")
-    for symbol in test_symbols[:1]:  # Test with first symbol
-        consolidated_view = market_view_manager.get_consolidated_market_view(symbol, test_exchanges)
+    # Submit every symbol/exchange fetch up front in one batched call
+    view_symbols = test_symbols[:1]  # Test with first symbol
+    consolidated_views = market_view_manager.get_consolidated_market_views(
+        {symbol: test_exchanges for symbol in view_symbols}
+    )
+    for symbol in view_symbols:
+        consolidated_view = consolidated_views.get(symbol)
         
         if consolidated_view:
             print(f"   {symbol}:")
@@ -119,7 +129,7 @@ def demo_complete_system():
         print(f"   Active arbitrage opportunities: {len(active_opps)}")
         
         # Get CBBO for the same symbol
-        cbbo = market_view_manager.get_cbbo(symbol)
+        cbbo = market_view_manager.get_cbbo(symbol, exchanges=test_exchanges)
         if cbbo:
             print(f"   CBBO for {symbol}:")
             print(f"     Best Bid: {cbbo.cbbo_bid_price:.4f} on {cbbo.cbbo_bid_exchange}")
@@ -148,4 +158,5 @@ def demo_complete_system():
 
 if __name__ == "__main__":
     setup_logging()
-    demo_complete_system()
\ No newline at end of file
+    with demo_cassette("demo_complete_system"):
+        demo_complete_system()
\ No newline at end of file
@@ -2,13 +2,8 @@
 Demo script for the Interactive Features
 This script demonstrates the enhanced interactive capabilities of the Telegram bot.
 """
-import sys
-import os
 import logging
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
 def demo_interactive_features():
     """Demonstrate the interactive features"""
     print("Generic Trading Bot - Interactive Features Demo")
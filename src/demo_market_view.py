@@ -2,17 +2,8 @@
 Demo script for the Market View Module
 This script demonstrates the complete functionality of the market view system.
 """
-import sys
-import os
 import logging
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
-from config.config_manager import ConfigManager
-from data_acquisition.market_data_fetcher import MarketDataFetcher
-from data_processing.market_view import MarketViewManager
-
 def setup_logging():
     """Setup logging configuration"""
     logging.basicConfig(
@@ -22,19 +13,23 @@ def setup_logging():
 
 def demo_market_view():
     """Demonstrate the market view functionality"""
+    # Importing these loads CCXT; do it only when the demo runs
+    from data_acquisition.market_data_fetcher import get_market_fetcher
+    from data_acquisition.symbol_cache import get_all_symbols_cached
+    from data_processing.market_view import MarketViewManager
+    
     print("Generic Trading Bot - Market View Demo")
     print("=" * 40)
     
     # Initialize components
-    config = ConfigManager()
-    market_fetcher = MarketDataFetcher(config)
+    market_fetcher = get_market_fetcher()
     market_view_manager = MarketViewManager(market_fetcher)
     
     print(f"Initialized Market View Manager")
     
     # Get available symbols
     print("\n1. Discovering available symbols...")
-    all_symbols = market_fetcher.get_all_symbols()
+    all_symbols = get_all_symbols_cached(market_fetcher)
     
     if not all_symbols:
         print("❌ Failed to retrieve symbols. Please check your exchange API configuration.")
@@ -64,8 +59,10 @@ def demo_market_view():
     
     # Test market data fetching
     print("\n3. Testing market data fetching...")
-    for exchange in test_exchanges[:2]:  # Test with first 2 exchanges
-        market_data = market_view_manager.get_market_data(exchange, test_symbol)
+    batch_exchanges = test_exchanges[:2]  # Test with first 2 exchanges
+    batch_data = market_view_manager.get_market_data_batch(batch_exchanges, test_symbol)
+    for exchange in batch_exchanges:
+        market_data = batch_data.get(exchange)
         if market_data:
             print(f"   {exchange}: Bid ${market_data.bid_price:.4f} ({market_data.bid_size}), "
                   f"Ask ${market_data.ask_price:.4f} ({market_data.ask_size})")
@@ -87,7 +84,7 @@ def demo_market_view():
     
     # Test CBBO
     print("\n5. Testing CBBO (Consolidated Best Bid/Offer)...")
-    cbbo = market_view_manager.get_cbbo(test_symbol)
+    cbbo = market_view_manager.get_cbbo(test_symbol, exchanges=test_exchanges)
     
     if cbbo:
         print(f"   Symbol: {cbbo.symbol}")
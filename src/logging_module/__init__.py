@@ -1,3 +1,3 @@
-from .logger import CustomLogger
+from .logger import CustomLogger, LazyLogger, get_custom_logger, tail
 
-__all__ = ['CustomLogger']
\ No newline at end of file
+__all__ = ['CustomLogger', 'LazyLogger', 'get_custom_logger', 'tail']
\ No newline at end of file
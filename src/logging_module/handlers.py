@@ -0,0 +1,104 @@
+"""
+Buffered log file handlers for the Generic Trading Bot
+"""
+import logging
+import os
+import stat
+import threading
+import time
+import weakref
+from logging.handlers import RotatingFileHandler
+
+# Size of the user-space buffer in front of each log file
+LOG_BUFFER_SIZE = 64 * 1024
+# Seconds between background flushes of buffered records
+LOG_FLUSH_INTERVAL = 30.0
+
+# Handlers the background thread flushes; weak so closed handlers drop out
+_buffered_handlers = weakref.WeakSet()
+_flusher_lock = threading.Lock()
+_flusher = None
+
+def _flush_periodically():
+    """Flush every live buffered handler once per LOG_FLUSH_INTERVAL"""
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        for handler in list(_buffered_handlers):
+            handler.flush()
+
+def _register(handler: logging.Handler):
+    """Add a handler to the background flush set, starting the thread on first use"""
+    global _flusher
+    _buffered_handlers.add(handler)
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_periodically, name="log-flusher", daemon=True)
+            _flusher.start()
+
+def flush_buffered(filename: str):
+    """Flush the buffered handlers writing to filename, so readers see every record"""
+    path = os.path.abspath(filename)
+    for handler in list(_buffered_handlers):
+        if handler.baseFilename == path:
+            handler.flush()
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that coalesces records into buffered writes
+
+    Records below flush_level stay in a LOG_BUFFER_SIZE buffer until it fills,
+    the background thread flushes it, or the handler is closed (which
+    logging.shutdown does at exit). Records at or above flush_level are
+    flushed immediately, so errors reach the disk before a crash.
+
+    The file size is tracked in memory instead of seeking to the end of the
+    file for every record, which would flush the buffer each time.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, flush_level=logging.ERROR):
+        self.flush_level = flush_level
+        self._deferring = False
+        self._size = 0
+        self._pending = 0
+        self._regular_file = True
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+        _register(self)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE, encoding=self.encoding)
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        # See bpo-45401: never roll over anything other than a regular file
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def shouldRollover(self, record):
+        if self.stream is None:  # delay was set...
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._regular_file:
+            return False
+        # Remember the size so emit can count it once the record is written;
+        # count encoded bytes, since log lines carry multi-byte emoji
+        line = self.format(record) + self.terminator
+        self._pending = len(line.encode(self.stream.encoding, self.stream.errors))
+        return self._size + self._pending >= self.maxBytes
+
+    def emit(self, record):
+        # StreamHandler.emit flushes after every write; hold that back for
+        # records below flush_level
+        self._deferring = record.levelno < self.flush_level
+        self._pending = 0
+        try:
+            super().emit(record)
+            self._size += self._pending
+        finally:
+            self._deferring = False
+
+    def flush(self):
+        with self.lock:
+            if not self._deferring:
+                super().flush()
+                # Resync with the file once the buffer is written out, which
+                # also corrects any newline translation the count missed
+                if self.stream is not None and self._regular_file:
+                    self._size = self.stream.tell()
@@ -1,10 +1,144 @@
 """
 Custom Logger for the Generic Trading Bot
 """
+import atexit
 import logging
 import os
+import queue
+import warnings
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import List
+
+from logging_module.handlers import BufferedRotatingFileHandler, flush_buffered
+
+# Directory for log files, relative to the working directory
+LOG_DIR = Path("logs")
+# Date stamp in log file names, fixed at process start
+LOG_DATE = datetime.now().strftime('%Y%m%d')
+
+@lru_cache(maxsize=None)
+def _make_log_dir(cwd: str) -> Path:
+    (Path(cwd) / LOG_DIR).mkdir(exist_ok=True)
+    return LOG_DIR
+
+def ensure_log_dir() -> Path:
+    """Create the log directory once per working directory and return it"""
+    return _make_log_dir(os.getcwd())
+
+# Record layout for routine messages
+STANDARD_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Record layout for errors, with the source location of the call
+DETAILED_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s() - %(message)s'
+
+# None of the formats show thread or process details, so skip gathering
+# them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+class LevelSplitFormatter(logging.Formatter):
+    """Formatter that adds the source location only to ERROR and above"""
+    
+    def __init__(self):
+        super().__init__(STANDARD_FORMAT)
+        self._detailed = logging.Formatter(DETAILED_FORMAT)
+        
+    def format(self, record: logging.LogRecord) -> str:
+        if record.levelno >= logging.ERROR:
+            return self._detailed.format(record)
+        return super().format(record)
+
+class LazyLogger:
+    """Logger wrapper that skips disabled levels before any work is done
+    
+    Pass values as %-style arguments rather than formatting them into the
+    message, e.g. ``logger.debug("Spread for %s: %.4f", symbol, spread)``.
+    An f-string is built before the level check runs, so it costs the same
+    whether or not the record is emitted; arguments are only formatted for
+    records that are. Other Logger attributes are forwarded unchanged.
+    """
+    
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+        
+    def _emit(self, level: int, msg: str, args: tuple, kwargs: dict):
+        if not self._logger.isEnabledFor(level):
+            return
+        if args and isinstance(msg, str) and '{}' in msg:
+            # Flag the call site without failing the code that is logging; the
+            # default warnings filter reports each location only once
+            warnings.warn(
+                f"Log message uses {{}} placeholders; use %-style arguments instead: {msg!r}",
+                stacklevel=3
+            )
+        # Attribute the record to our caller's caller, not to this wrapper
+        kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + 2
+        self._logger.log(level, msg, *args, **kwargs)
+        
+    def log(self, level: int, msg: str, *args, **kwargs):
+        self._emit(level, msg, args, kwargs)
+        
+    def debug(self, msg: str, *args, **kwargs):
+        self._emit(logging.DEBUG, msg, args, kwargs)
+        
+    def info(self, msg: str, *args, **kwargs):
+        self._emit(logging.INFO, msg, args, kwargs)
+        
+    def warning(self, msg: str, *args, **kwargs):
+        self._emit(logging.WARNING, msg, args, kwargs)
+        
+    def error(self, msg: str, *args, **kwargs):
+        self._emit(logging.ERROR, msg, args, kwargs)
+        
+    def exception(self, msg: str, *args, exc_info=True, **kwargs):
+        kwargs['exc_info'] = exc_info
+        self._emit(logging.ERROR, msg, args, kwargs)
+        
+    def critical(self, msg: str, *args, **kwargs):
+        self._emit(logging.CRITICAL, msg, args, kwargs)
+        
+    def __getattr__(self, name: str):
+        return getattr(self._logger, name)
+
+def tail(name: str, max_bytes: int = 1_000_000) -> str:
+    """Read the end of today's log file for a logger name
+    
+    Only the last max_bytes of the file are read, so the cost does not grow
+    with the size of the log. A line cut off at the start of that window is
+    dropped.
+    
+    Args:
+        name (str): Log file prefix, e.g. 'trading_bot' or 'errors'
+        max_bytes (int): Maximum number of bytes to read from the end
+        
+    Returns:
+        str: The trailing complete lines, or '' if the file does not exist
+    """
+    log_filename = str(LOG_DIR / f"{name}_{LOG_DATE}.log")
+    flush_buffered(log_filename)
+    try:
+        with open(log_filename, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - max_bytes)
+            f.seek(start)
+            if start > 0:
+                f.readline()  # Discard the partial first line
+            return f.read().decode('utf-8', errors='replace')
+    except FileNotFoundError:
+        return ""
+
+# Listener threads writing the records queued by each CustomLogger
+_listeners: List[QueueListener] = []
+
+def _stop_queue_listeners():
+    """Stop every listener thread, draining any queued records"""
+    while _listeners:
+        _listeners.pop().stop()
+        
+atexit.register(_stop_queue_listeners)
 
 class CustomLogger:
     """Custom logger implementation for the trading bot"""
@@ -25,14 +159,9 @@ class CustomLogger:
         if self.logger.handlers:
             return
         
-        # Create logs directory if it doesn't exist
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-            
-        # Create rotating file handler
-        log_filename = f"{log_dir}/{name}_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = RotatingFileHandler(
+        # Create rotating file handler; records below ERROR are buffered
+        log_filename = ensure_log_dir() / f"{name}_{LOG_DATE}.log"
+        file_handler = BufferedRotatingFileHandler(
             log_filename, 
             maxBytes=max_file_size, 
             backupCount=backup_count
@@ -44,16 +173,34 @@ class CustomLogger:
         console_handler.setLevel(log_level)
         
         # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s() - %(message)s'
-        )
+        formatter = LevelSplitFormatter()
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # The logger only enqueues records; file writes, rollover checks and
+        # console output happen on a listener thread
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
         
     def get_logger(self) -> logging.Logger:
         """Get the configured logger instance"""
-        return self.logger
\ No newline at end of file
+        return self.logger
+
+@lru_cache(maxsize=None)
+def get_custom_logger(name: str, log_level: int = logging.INFO, max_file_size: int = 10*1024*1024,
+                      backup_count: int = 5) -> CustomLogger:
+    """Get the CustomLogger for a name, creating it on first use
+    
+    Args:
+        name (str): Logger name
+        log_level (int): Logging level
+        max_file_size (int): Maximum log file size in bytes (default 10MB)
+        backup_count (int): Number of backup files to keep
+        
+    Returns:
+        CustomLogger: The shared CustomLogger for these arguments
+    """
+    return CustomLogger(name, log_level, max_file_size, backup_count)
\ No newline at end of file
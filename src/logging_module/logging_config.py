@@ -1,10 +1,17 @@
 """
 Logging Configuration for the Generic Trading Bot
 """
+import atexit
 import logging
 import logging.config
-import os
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from logging_module.logger import DETAILED_FORMAT, LOG_DATE, STANDARD_FORMAT, LazyLogger, ensure_log_dir
+
+# Background thread that owns the real handlers once setup_logging has run
+_listener: Optional[QueueListener] = None
 
 def setup_logging(log_level: str = "INFO", log_to_file: bool = True, log_to_console: bool = True):
     """Set up logging configuration for the entire application
@@ -14,10 +21,11 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True, log_to_cons
         log_to_file (bool): Whether to log to file
         log_to_console (bool): Whether to log to console
     """
-    # Create logs directory if it doesn't exist
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    # Flush and retire any listener from a previous call before dictConfig
+    # replaces the root handlers
+    _stop_queue_listener()
+    
+    log_dir = ensure_log_dir()
     
     # Define logging configuration
     config = {
@@ -25,7 +33,10 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True, log_to_cons
         'disable_existing_loggers': False,
         'formatters': {
             'detailed': {
-                'format': '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s() - %(message)s'
+                'format': DETAILED_FORMAT
+            },
+            'standard': {
+                'format': STANDARD_FORMAT
             },
             'simple': {
                 'format': '%(asctime)s - %(levelname)s - %(message)s'
@@ -39,19 +50,19 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True, log_to_cons
                 'stream': 'ext://sys.stdout'
             },
             'file': {
-                'class': 'logging.handlers.RotatingFileHandler',
+                'class': 'logging_module.handlers.BufferedRotatingFileHandler',
                 'level': log_level,
-                'formatter': 'detailed',
-                'filename': f'{log_dir}/trading_bot_{datetime.now().strftime("%Y%m%d")}.log',
+                'formatter': 'standard',
+                'filename': str(log_dir / f'trading_bot_{LOG_DATE}.log'),
                 'maxBytes': 10485760,  # 10MB
                 'backupCount': 5,
                 'encoding': 'utf8'
             },
             'error_file': {
-                'class': 'logging.handlers.RotatingFileHandler',
+                'class': 'logging_module.handlers.BufferedRotatingFileHandler',
                 'level': 'ERROR',
                 'formatter': 'detailed',
-                'filename': f'{log_dir}/errors_{datetime.now().strftime("%Y%m%d")}.log',
+                'filename': str(log_dir / f'errors_{LOG_DATE}.log'),
                 'maxBytes': 10485760,  # 10MB
                 'backupCount': 5,
                 'encoding': 'utf8'
@@ -79,13 +90,46 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True, log_to_cons
     # Apply configuration
     logging.config.dictConfig(config)
     
-def get_logger(name: str) -> logging.Logger:
+    # Only debug runs print tracebacks for records a handler fails to emit
+    logging.raiseExceptions = log_level.upper() == "DEBUG"
+    
+    # Hand the configured handlers to a listener thread so logging calls on
+    # the trading threads only enqueue the record
+    _start_queue_listener(logging.getLogger())
+    
+def _start_queue_listener(root: logging.Logger):
+    """Move the root logger's handlers behind a QueueHandler/QueueListener pair"""
+    global _listener
+    handlers = list(root.handlers)
+    if not handlers:
+        return
+    for handler in handlers:
+        root.removeHandler(handler)
+        
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+def _stop_queue_listener():
+    """Stop the listener thread, draining any queued records"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        
+atexit.register(_stop_queue_listener)
+    
+def get_logger(name: str) -> LazyLogger:
     """Get a logger with the specified name
     
+    Calls for disabled levels return before any formatting, so pass values
+    as %-style arguments instead of f-strings (see LazyLogger).
+    
     Args:
         name (str): Logger name
         
     Returns:
-        logging.Logger: Configured logger instance
+        LazyLogger: Configured logger instance
     """
-    return logging.getLogger(name)
\ No newline at end of file
+    return LazyLogger(logging.getLogger(name))
\ No newline at end of file
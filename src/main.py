@@ -2,12 +2,8 @@
 Main entry point for the Generic Trading Bot
 """
 import sys
-import os
 from dotenv import load_dotenv
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 # Load environment variables
 load_dotenv()
 
@@ -25,10 +21,8 @@ def main():
             print("Failed to start the application")
             return 1
             
-        # Keep the application running
-        while app_controller.is_running():
-            import time
-            time.sleep(1)
+        # Keep the application running until it is stopped
+        app_controller.wait()
             
     except KeyboardInterrupt:
         print("\nReceived interrupt signal, shutting down...")
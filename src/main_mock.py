@@ -5,24 +5,8 @@ This version uses simulated market data.
 import sys
 import os
 import logging
-from telegram_bot.bot_handler import TelegramBotHandler
-from config.config_manager import ConfigManager
-from data_acquisition.mock_market_data_fetcher import MockMarketDataFetcher
-from data_processing.arbitrage_detector import ArbitrageDetector
-from data_processing.market_view import MarketViewManager
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
-# Load environment variables from .env file
-env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
-if os.path.exists(env_path):
-    with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                os.environ[key] = value
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
 
 def setup_logging():
     """Setup logging configuration"""
@@ -33,6 +17,17 @@ def setup_logging():
 
 def main():
     """Main entry point for the trading bot with mock data"""
+    # The bot, CCXT and the processing modules are only needed once the bot
+    # actually runs; importing them here keeps `import main_mock` cheap
+    from telegram_bot.bot_handler import TelegramBotHandler
+    from config.config_manager import get_config
+    from data_acquisition.mock_market_data_fetcher import MockMarketDataFetcher
+    from data_processing.arbitrage_detector import ArbitrageDetector
+    from data_processing.market_view import MarketViewManager
+    
+    # Load environment variables from the project's .env file
+    load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+    
     print("Generic Trading Bot - Mock Data Version")
     print("=" * 40)
     print("Running with simulated market data")
@@ -44,7 +39,7 @@ def main():
     
     try:
         # Initialize configuration
-        config = ConfigManager()
+        config = get_config()
         
         # Check if Telegram token is configured
         if not config.telegram_token:
@@ -87,10 +82,12 @@ def main():
         test_symbol = 'BTCUSDT'
         
         if test_exchange in all_symbols and test_symbol in all_symbols[test_exchange]:
-            opportunities = arbitrage_detector.find_arbitrage_opportunities(
-                ['binance', 'okx', 'bybit', 'deribit'], 
-                test_symbol
-            )
+            # Fetch every exchange's quote concurrently in one batch
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                opportunities = arbitrage_detector.find_arbitrage_opportunities_batch(
+                    {test_symbol: ['binance', 'okx', 'bybit', 'deribit']},
+                    executor=executor
+                ).get(test_symbol, [])
             print(f"\n   Arbitrage test for {test_symbol}:")
             print(f"     Found {len(opportunities)} opportunities")
             
@@ -2,81 +2,185 @@
 Test Runner for the Generic Trading Bot
 Runs all tests in the proper sequence to validate the complete system
 """
+import contextlib
+import io
+import multiprocessing
 import sys
 import os
-import subprocess
+import runpy
 import time
+from multiprocessing.pool import Pool
+from typing import Dict, List, Tuple
 
-# Add src to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+try:
+    import pytest
+except ImportError:
+    pytest = None
 
-def run_test_script(script_path: str, description: str) -> bool:
-    """Run a test script and return success status"""
-    print(f"\n{'='*60}")
-    print(f"Running {description}")
-    print(f"{'='*60}")
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Basic module tests; independent of each other, so they run concurrently
+MODULE_SUITES = [
+    ("src/config/test_user_config_manager.py", "Configuration Management Tests"),
+    ("src/utils/test_error_handling.py", "Error Handling Tests"),
+    ("src/data_acquisition/test_data_acquisition.py", "Data Acquisition Tests"),
+    ("src/data_processing/test_arbitrage_detector.py", "Arbitrage Detection Tests"),
+    ("src/data_processing/test_market_view.py", "Market View Tests"),
+    ("src/data_processing/test_service_controller.py", "Service Controller Tests"),
+    ("src/telegram_bot/test_alert_manager.py", "Alert Manager Tests"),
+]
+
+# Integration tests; started only once every module test has finished
+INTEGRATION_SUITES = [
+    ("src/system/test_validation_scenarios.py", "Validation Scenarios Tests"),
+    ("src/system/test_system_integration.py", "System Integration Tests")
+]
+
+# Test suites in order of dependency
+TEST_SUITES = MODULE_SUITES + INTEGRATION_SUITES
+
+# Seconds a group's test scripts may run before the unfinished ones are failed
+SCRIPT_TIMEOUT = 600
+
+class _SuiteResults:
+    """pytest plugin recording which test files had failures"""
     
-    try:
-        # Run the test script
-        result = subprocess.run([
-            sys.executable, 
-            script_path
-        ], cwd=os.path.dirname(script_path), capture_output=True, text=True, timeout=120)
+    def __init__(self):
+        self.ran = set()
+        self.failed = set()
         
-        # Print output
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
+    def _path(self, report) -> str:
+        return os.path.normcase(os.path.join(PROJECT_ROOT, report.nodeid.split("::")[0]))
+        
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.failed.add(self._path(report))
             
-        return result.returncode == 0
+    def pytest_runtest_logreport(self, report):
+        path = self._path(report)
+        self.ran.add(path)
+        if report.failed:
+            self.failed.add(path)
+
+def is_script(script_path: str) -> bool:
+    """Whether a test file is a standalone script with its own entry point"""
+    with open(script_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    return "__name__ == \"__main__\"" in source or "__name__ == '__main__'" in source
+
+def run_pytest_suites(script_paths: List[str]) -> Dict[str, bool]:
+    """Run pytest modules in this interpreter and report success per file"""
+    args = ['-q', '-rA', '-p', 'no:cacheprovider', '--rootdir', PROJECT_ROOT, *script_paths]
+    try:
+        import xdist  # noqa: F401 - only checking that pytest-xdist is installed
+        args[:0] = ['-n', 'auto']
+    except ImportError:
+        pass
         
-    except subprocess.TimeoutExpired:
-        print(f"❌ {description} timed out")
-        return False
+    results = _SuiteResults()
+    pytest.main(args, plugins=[results])
+    return {
+        path: os.path.normcase(path) in results.ran and os.path.normcase(path) not in results.failed
+        for path in script_paths
+    }
+
+def run_test_script(script_path: str, description: str) -> bool:
+    """Run a test script's entry point in this interpreter and return success status"""
+    # Run from the script's directory, as if it had been started directly
+    previous_cwd = os.getcwd()
+    os.chdir(os.path.dirname(script_path))
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+        return True
+    except SystemExit as e:
+        return e.code in (None, 0)
     except Exception as e:
         print(f"❌ {description} failed with exception: {e}")
         return False
+    finally:
+        os.chdir(previous_cwd)
+
+def run_test_script_captured(script_path: str, description: str) -> Tuple[bool, str]:
+    """Run a test script in a worker process, returning its success status and output"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        success = run_test_script(script_path, description)
+    return success, output.getvalue()
+
+def run_suite_group(pool: Pool, suites: List[Tuple[str, str]]) -> Dict[str, Tuple[bool, str]]:
+    """Run a group of suites concurrently and wait for all of them
+    
+    Script suites go to the process pool with their output captured, while
+    pytest modules run in this process in the meantime. Without pytest
+    installed only the script suites can run; the others are reported failed.
+    
+    Returns:
+        Dict mapping each suite path to (success, captured output)
+    """
+    script_results = {
+        path: pool.apply_async(run_test_script_captured, (path, description))
+        for path, description in suites if is_script(path)
+    }
+    deadline = time.monotonic() + SCRIPT_TIMEOUT
+    pytest_paths = [path for path, _ in suites if not is_script(path)]
+    
+    results = {}
+    if pytest_paths and pytest is None:
+        for path in pytest_paths:
+            results[path] = (False, "❌ pytest is not installed; install the 'dev' extra to run this suite\n")
+    elif pytest_paths:
+        for path, success in run_pytest_suites(pytest_paths).items():
+            results[path] = (success, "")
+    for path, async_result in script_results.items():
+        try:
+            results[path] = async_result.get(timeout=max(0.0, deadline - time.monotonic()))
+        except multiprocessing.TimeoutError:
+            results[path] = (False, f"❌ Timed out after {SCRIPT_TIMEOUT} seconds\n")
+        except Exception as e:
+            results[path] = (False, f"❌ Worker failed with exception: {e}\n")
+    return results
 
 def run_module_tests() -> dict:
     """Run individual module tests"""
     print("Generic Trading Bot - Complete System Test")
     print("=" * 60)
     
-    # Define test scripts in order of dependency
-    test_scripts = [
-        # Basic module tests
-        ("src/config/test_user_config_manager.py", "Configuration Management Tests"),
-        ("src/utils/test_error_handling.py", "Error Handling Tests"),
-        ("src/data_acquisition/test_data_acquisition.py", "Data Acquisition Tests"),
-        ("src/data_processing/test_arbitrage_detector.py", "Arbitrage Detection Tests"),
-        ("src/data_processing/test_market_view.py", "Market View Tests"),
-        ("src/data_processing/test_service_controller.py", "Service Controller Tests"),
-        ("src/telegram_bot/test_alert_manager.py", "Alert Manager Tests"),
-        
-        # Integration tests
-        ("src/system/test_validation_scenarios.py", "Validation Scenarios Tests"),
-        ("src/system/test_system_integration.py", "System Integration Tests")
-    ]
-    
+    groups: List[List[Tuple[str, str]]] = []
     results = {}
-    passed = 0
-    total = len(test_scripts)
-    
-    # Run each test script
-    for script_path, description in test_scripts:
-        full_path = os.path.join(os.path.dirname(__file__), '..', script_path)
-        if os.path.exists(full_path):
-            success = run_test_script(full_path, description)
+    for group in (MODULE_SUITES, INTEGRATION_SUITES):
+        suites = []
+        for script_path, description in group:
+            full_path = os.path.join(PROJECT_ROOT, script_path)
+            if os.path.exists(full_path):
+                suites.append((full_path, description))
+            else:
+                print(f"\n⚠️  {description} - Script not found: {script_path}")
+                results[description] = False
+        groups.append(suites)
+        
+    for suites in groups:
+        # A fresh worker per script keeps module state from leaking between
+        # suites; terminate() also stops any script that timed out
+        pool = Pool(processes=os.cpu_count(), maxtasksperchild=1)
+        try:
+            group_results = run_suite_group(pool, suites)
+        finally:
+            pool.terminate()
+            pool.join()
+            
+        # Print each suite's output whole, in the order the suites are listed
+        for full_path, description in suites:
+            success, output = group_results[full_path]
+            if output:
+                print(f"\n{'='*60}")
+                print(f"Running {description}")
+                print(f"{'='*60}")
+                print(output, end="")
             results[description] = success
-            if success:
-                passed += 1
             print(f"\n{'✅' if success else '❌'} {description} {'PASSED' if success else 'FAILED'}")
-        else:
-            print(f"\n⚠️  {description} - Script not found: {script_path}")
-            results[description] = False
     
-    return results
+    # Report in the order the suites are listed
+    return {description: results[description] for _, description in TEST_SUITES}
 
 def print_summary(results: dict):
     """Print test results summary"""
@@ -119,7 +119,8 @@ class ValidationScenariosTest:
             # Get actual CBBO
             consolidated_view = self.market_view_manager.get_consolidated_market_view(
                 'BTC-USDT', 
-                ['binance', 'okx', 'bybit']
+                ['binance', 'okx', 'bybit'],
+                cached_only=True
             )
             
             if consolidated_view:
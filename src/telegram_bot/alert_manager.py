@@ -6,11 +6,18 @@ import logging
 import time
 import threading
 import asyncio
+from functools import lru_cache
 from typing import Dict, List, Optional
 from telegram import Bot
 from telegram.error import TelegramError
 from data_processing.models import ArbitrageOpportunity, ConsolidatedMarketView
 
+@lru_cache(maxsize=256)
+def _format_utc(seconds: int) -> str:
+    """Format a whole-second Unix timestamp for alert messages"""
+    # Alerts raised within the same second share one strftime call
+    return time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(seconds))
+
 class AlertManager:
     """Manages alert notifications for the Telegram bot"""
     
@@ -145,19 +152,18 @@ class AlertManager:
             str: Formatted alert message
         """
         # Convert timestamp to readable format
-        timestamp = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(opportunity.timestamp))
-        
-        alert_message = f"""
-🔔 *ARBITRAGE OPPORTUNITY DETECTED*
-
-Asset: {opportunity.symbol}
-Exchange A: {opportunity.buy_exchange.upper()} @ ${opportunity.buy_price:,.2f}
-Exchange B: {opportunity.sell_exchange.upper()} @ ${opportunity.sell_price:,.2f}
-Spread: ${opportunity.profit_absolute:,.2f} ({opportunity.profit_percentage:.2f}%)
-Threshold: {opportunity.threshold_percentage:.2f}%
-Time: {timestamp}
-"""
-        return alert_message.strip()
+        timestamp = _format_utc(int(opportunity.timestamp))
+        
+        return (
+            "🔔 *ARBITRAGE OPPORTUNITY DETECTED*\n"
+            "\n"
+            f"Asset: {opportunity.symbol}\n"
+            f"Exchange A: {opportunity.buy_exchange.upper()} @ ${opportunity.buy_price:,.2f}\n"
+            f"Exchange B: {opportunity.sell_exchange.upper()} @ ${opportunity.sell_price:,.2f}\n"
+            f"Spread: ${opportunity.profit_absolute:,.2f} ({opportunity.profit_percentage:.2f}%)\n"
+            f"Threshold: {opportunity.threshold_percentage:.2f}%\n"
+            f"Time: {timestamp}"
+        )
         
     def format_market_view_alert(self, market_view: ConsolidatedMarketView) -> str:
         """
@@ -173,18 +179,17 @@ Time: {timestamp}
         cbbo_mid = (market_view.cbbo_bid_price + market_view.cbbo_ask_price) / 2
         
         # Convert timestamp to readable format
-        timestamp = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(market_view.timestamp))
-        
-        alert_message = f"""
-📊 *MARKET VIEW UPDATE*
-
-Symbol: {market_view.symbol}
-Best Bid: {market_view.cbbo_bid_exchange.upper()} @ ${market_view.cbbo_bid_price:,.2f}
-Best Offer: {market_view.cbbo_ask_exchange.upper()} @ ${market_view.cbbo_ask_price:,.2f}
-CBBO Mid: ${cbbo_mid:,.2f}
-Time: {timestamp}
-"""
-        return alert_message.strip()
+        timestamp = _format_utc(int(market_view.timestamp))
+        
+        return (
+            "📊 *MARKET VIEW UPDATE*\n"
+            "\n"
+            f"Symbol: {market_view.symbol}\n"
+            f"Best Bid: {market_view.cbbo_bid_exchange.upper()} @ ${market_view.cbbo_bid_price:,.2f}\n"
+            f"Best Offer: {market_view.cbbo_ask_exchange.upper()} @ ${market_view.cbbo_ask_price:,.2f}\n"
+            f"CBBO Mid: ${cbbo_mid:,.2f}\n"
+            f"Time: {timestamp}"
+        )
         
     def send_arbitrage_alert(self, opportunity: ArbitrageOpportunity) -> Dict[int, int]:
         """
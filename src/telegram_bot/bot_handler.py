@@ -23,6 +23,9 @@ from utils.error_handler import (
     InvalidUserInputError, BotAPIError, log_exception, handle_exception
 )
 
+# Seconds Telegram holds a getUpdates request open while no updates arrive
+LONG_POLLING_TIMEOUT = 50
+
 class TelegramBotHandler:
     """Handles all Telegram bot interactions"""
     
@@ -100,10 +103,32 @@ class TelegramBotHandler:
             # Register message handler
             self.application.add_handler(MessageHandler(Filters.TEXT & (~Filters.COMMAND), self._echo_message))
             
+            use_webhook = self.config.telegram_use_webhook
+            if use_webhook and not self.config.telegram_webhook_url:
+                self.logger.warning("TELEGRAM_USE_WEBHOOK is set but TELEGRAM_WEBHOOK_URL is not; falling back to long polling")
+                use_webhook = False
+                
             # Start the bot in a separate thread to avoid blocking
             def run_bot():
                 asyncio.set_event_loop(self.bot_loop)
-                self.application.run_polling(allowed_updates=Update.ALL_TYPES)
+                if use_webhook:
+                    # Telegram pushes updates, so no getUpdates requests are made
+                    token = self.config.telegram_token
+                    self.application.run_webhook(
+                        listen="0.0.0.0",
+                        port=self.config.telegram_webhook_port,
+                        url_path=token,
+                        webhook_url=self.config.telegram_webhook_url + token,
+                        allowed_updates=Update.ALL_TYPES
+                    )
+                else:
+                    # Long polling: each getUpdates blocks server-side until an
+                    # update arrives or the timeout expires
+                    self.application.run_polling(
+                        poll_interval=0.0,
+                        timeout=LONG_POLLING_TIMEOUT,
+                        allowed_updates=Update.ALL_TYPES
+                    )
                 
             bot_thread = threading.Thread(target=run_bot, daemon=True)
             bot_thread.start()
@@ -126,6 +151,8 @@ class TelegramBotHandler:
                 self.logger.info("Telegram bot stopped")
                 # Save user configurations
                 self.user_config_manager.save_config()
+            if self.service_controller:
+                self.service_controller.close()
         except Exception as e:
             log_exception(self.logger, e, "Error stopping Telegram bot")
             raise TelegramBotError(f"Error stopping Telegram bot: {e}")